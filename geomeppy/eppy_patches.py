@@ -15,17 +15,23 @@ of Eppy.
 """
 import copy
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union  # noqa
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union  # noqa
 
 from eppy import bunchhelpers, iddgaps
-from eppy.EPlusInterfaceFunctions import eplusdata, iddindex, parse_idd
+from eppy.EPlusInterfaceFunctions import eplusdata, iddindex
 from eppy.EPlusInterfaceFunctions.eplusdata import Eplusdata  # noqa
-from eppy.bunch_subclass import EpBunch as BaseBunch
+from eppy.bunch_subclass import BadEPFieldError, EpBunch as BaseBunch
 from eppy.idf_msequence import Idf_MSequence
-from eppy.idfreader import convertallfields, iddversiontuple
+from eppy.idfreader import convertfields, iddversiontuple
 from eppy.modeleditor import IDDNotSetError, IDF as BaseIDF, namebunch, newrawobject
+import numpy as np  # noqa
 from six import StringIO  # noqa
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # Python 2
+    from collections import MutableMapping
+
 from geomeppy.geom.intersect_match import (
     intersect_idf_surfaces,
     getidfsurfaces,
@@ -34,15 +40,39 @@ from geomeppy.geom.intersect_match import (
     match_idf_surfaces,
     set_coords,
 )
+from . import idd_cache
 from .builder import Block, Zone
+from .geom.geometry_table import GEOMETRY_KEYS, GeometryTable, surfaces_extent
 from .geom.polygons import Polygon, Polygon3D  # noqa
 from .geom.vectors import Vector2D, Vector3D  # noqa
-from .recipes import set_default_constructions, set_wwr, rotate, scale, translate, translate_to_origin
+from .recipes import set_default_constructions, set_wwr, translate_to_origin, TransformContext
 from .view_geometry import view_idf
 
 
 class EpBunch(BaseBunch):
-    """Monkeypatched EpBunch to add the setcoords function."""
+    """Monkeypatched EpBunch to add the setcoords function, and to record changes to the geometry of the IDF."""
+
+    def __setattr__(self, name, value):
+        # type: (str, Any) -> None
+        super(EpBunch, self).__setattr__(name, value)
+        self._field_set(name)
+
+    def __setitem__(self, key, value):
+        # type: (str, Any) -> None
+        super(EpBunch, self).__setitem__(key, value)
+        self._field_set(key)
+
+    def _field_set(self, name):
+        # type: (str) -> None
+        """Tell the IDF its geometry has changed if a vertex field or the surface type of a surface has been set.
+
+        :param name: The name of the field.
+        """
+        if name != 'Surface_Type' and not name.startswith('Vertex_'):
+            return
+        idf = self.theidf
+        if idf is not None and hasattr(idf, 'geometry_changed') and self.key.upper() in GEOMETRY_KEYS:
+            idf.geometry_changed()
 
     def setcoords(self,
                   poly,  # type: Union[List[Vector3D], Polygon3D]
@@ -75,7 +105,10 @@ def idfreader1(fname,  # type: StringIO
                theidf,  # type: IDF
                conv=True,  # type: Optional[bool]
                commdct=None,  # type: Optional[List[Union[List[Dict[str, Any]], List[Dict[str, Option]]]]]
-               block=None  # type: Optional[List[List[str]]]
+               block=None,  # type: Optional[List[List[str]]]
+               cache_dir=None,  # type: Optional[str]
+               lazy=False,  # type: Optional[bool]
+               conv_keys=None  # type: Optional[Iterable[str]]
                ):
     # type: (...) -> Tuple[Dict, List, Eplusdata, List[Dict, Dict], Dict, Tuple[int]]
     # would like to have:
@@ -88,6 +121,11 @@ def idfreader1(fname,  # type: StringIO
     :param conv: If True, convert strings to floats and integers where marked in the IDD. Defaults to None.
     :param commdct: Descriptions of IDF fields from the IDD. Defaults to None.
     :param block: EnergyPlus field ID names of the IDF from the IDD. Defaults to None.
+    :param cache_dir: Directory for the on-disk cache of the parsed IDD. Defaults to None.
+    :param lazy: If True, make the bunches for each object type only when that type is first accessed. Their fields
+        are also converted then. Defaults to False.
+    :param conv_keys: Object types to convert the fields of, if `conv` is True. Defaults to None, which converts all
+        object types.
     :returns: bunchdt Dict of lists of idf_MSequence objects in the IDF.
     :returns: block EnergyPlus field ID names of the IDF from the IDD.
     :returns data: Eplusdata object containing representions of IDF objects.
@@ -101,25 +139,177 @@ def idfreader1(fname,  # type: StringIO
         fname,
         iddfile=iddfile,
         commdct=commdct,
-        block=block)
-    if conv:
-        convertallfields(data, commdct)
-    # fill gaps in idd
+        block=block,
+        cache_dir=cache_dir)
+    if not conv:
+        conv_keys = set()  # type: Set[str]
+    elif conv_keys is None:
+        conv_keys = set(data.dtls)
+    else:
+        conv_keys = {key.upper() for key in conv_keys}
+    if not lazy:
+        convertkeys(data, commdct, conv_keys)
+    fillgaps(block, commdct, data.dtls, versiontuple)
+    bunchdt = makebunches(data, commdct, theidf, lazy, conv_keys)
+
+    return bunchdt, block, data, commdct, idd_index, versiontuple
+
+
+def convertkeys(data,  # type: Eplusdata
+                commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optional[str]]]]]
+                keys  # type: Iterable[str]
+                ):
+    # type: (...) -> None
+    """Convert strings to floats and integers where marked in the IDD, for some object types.
+
+    This does the same as `convertallfields`, but only for the given object types, and works out the conversion for
+    each field once per object type rather than once per object.
+
+    :param data: Eplusdata object containing representions of IDF objects. This is updated in place.
+    :param commdct: Descriptions of IDF fields from the IDD.
+    :param keys: The upper case object types to convert.
+
+    """
+    key_index = getkeyindex(data)
+    for key in keys:
+        objs = data.dt.get(key)
+        if objs:
+            convertobjs(commdct[key_index[key]], objs)
+
+
+def convertobjs(key_comm, objs):
+    # type: (List[Dict[str, Any]], List[List[Union[str, float, int]]]) -> None
+    """Convert strings to floats and integers where marked in the IDD, for objects of one type.
+
+    :param key_comm: Descriptions of the fields of the object type from the IDD.
+    :param objs: List of objects, each a list of field values. These are updated in place.
+
+    """
+    typefunc = dict(integer=int, real=float)
+    convs = [(i, typefunc[comm['type'][0]]) for i, comm in enumerate(key_comm)
+             if comm.get('type', [None])[0] in typefunc]
+    for obj in objs:
+        n_fields = len(obj)
+        for i, conv in convs:
+            if i >= n_fields:
+                break
+            try:
+                obj[i] = conv(obj[i])
+            except ValueError:
+                pass
+
+
+def fillgaps(block,  # type: List[List[str]]
+             commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optional[str]]]]]
+             dtls,  # type: List[str]
+             versiontuple  # type: Tuple[int]
+             ):
+    # type: (...) -> None
+    """Fill in missing field names in the IDD, such as those of extensible fields.
+
+    :param block: EnergyPlus field ID names of the IDF from the IDD.
+    :param commdct: Descriptions of IDF fields from the IDD. This is updated in place.
+    :param dtls: List of the upper case object types in the IDD.
+    :param versiontuple: Version of EnergyPlus from the IDD.
+
+    """
     if versiontuple < (8,):
         skiplist = ["TABLE:MULTIVARIABLELOOKUP"]
     else:
         skiplist = None
     nofirstfields = iddgaps.missingkeys_standard(
-        commdct, data.dtls,
+        commdct, dtls,
         skiplist=skiplist)
-    iddgaps.missingkeys_nonstandard(block, commdct, data.dtls, nofirstfields)
-    bunchdt = makebunches(data, commdct, theidf)
+    iddgaps.missingkeys_nonstandard(block, commdct, dtls, nofirstfields)
 
-    return bunchdt, block, data, commdct, idd_index, versiontuple
 
+def readidd(iddfile, cache_dir=None):
+    # type: (Union[str, StringIO], Optional[str]) -> Tuple[List, List, Dict, Tuple[int]]
+    """Read the IDD without reading an IDF.
+
+    :param iddfile: Name of the IDD file, or an open file handle.
+    :param cache_dir: Directory for the on-disk cache of the parsed IDD. Defaults to None.
+    :returns: block EnergyPlus field ID names of the IDF from the IDD.
+    :returns: commdct Descriptions of IDF fields from the IDD, with any missing field names filled in.
+    :returns: idd_index A pair of dicts used for fast lookups of names of groups of objects.
+    :returns: versiontuple Version of EnergyPlus from the IDD.
+
+    """
+    versiontuple = iddversiontuple(iddfile)
+    block, commdct, idd_index = idd_cache.extractidddata(iddfile, cache_dir)
+    fillgaps(block, commdct, eplusdata.Idd(block, 2).dtls, versiontuple)
+    return block, commdct, idd_index, versiontuple
+
+
+def iterrawobjects(fhandle, keys=None):
+    # type: (Iterable[Union[str, bytes]], Optional[Iterable[str]]) -> Iterator[List[str]]
+    """Parse the objects in an IDF one at a time.
+
+    The text is split into objects and fields in the same way as by `Eplusdata`, but line by line, so only one object
+    is held in memory at a time.
 
-def readdatacommdct1(idfname, iddfile='Energy+.idd', commdct=None, block=None):
-    # type: (str, Optional[str], Optional[Dict], Optional[List]) -> Tuple[List, Eplusdata, List[Dict, Dict], Dict]
+    :param fhandle: An open IDF file, or any iterable of lines.
+    :param keys: Object types to return. Defaults to None, which returns all objects.
+    :returns: A generator of lists of the field values in each object, as strings.
+    """
+    if keys is not None:
+        keys = {key.upper() for key in keys}
+    pieces = []  # type: List[str]
+    for line in fhandle:
+        try:
+            line = line.decode('ISO-8859-2')
+        except AttributeError:
+            pass
+        text = line.rstrip('\r\n').split('!')[0]
+        while ';' in text:
+            head, text = text.split(';', 1)
+            pieces.append(head)
+            obj_text = '\n'.join(pieces)
+            pieces = []
+            key = obj_text.split(',', 1)[0].strip().upper()
+            if not key or (keys is not None and key not in keys):
+                continue
+            yield [field.strip() for field in obj_text.split(',')]
+        pieces.append(text)
+
+
+def iteridfobjects(fhandle,  # type: Iterable[Union[str, bytes]]
+                   commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optional[str]]]]]
+                   dtls,  # type: List[str]
+                   keys=None,  # type: Optional[Iterable[str]]
+                   conv=True  # type: Optional[bool]
+                   ):
+    # type: (...) -> Iterator[EpBunch]
+    """Make bunches from the objects in an IDF one at a time.
+
+    Objects of types which are not in the IDD are skipped.
+
+    :param fhandle: An open IDF file, or any iterable of lines.
+    :param commdct: Descriptions of IDF fields from the IDD.
+    :param dtls: List of the upper case object types in the IDD.
+    :param keys: Object types to return. Defaults to None, which returns all objects.
+    :param conv: If True, convert strings to floats and integers where marked in the IDD. Defaults to True.
+    :returns: A generator of EpBunch objects.
+    """
+    key_index = {}  # type: Dict[str, int]
+    for i, key in enumerate(dtls):
+        key_index.setdefault(key, i)
+    for obj in iterrawobjects(fhandle, keys):
+        obj_i = key_index.get(obj[0].upper())
+        if obj_i is None:
+            continue
+        if conv:
+            obj = convertfields(commdct[obj_i], obj)
+        yield makeabunch(commdct, obj, obj_i)
+
+
+def readdatacommdct1(idfname,  # type: str
+                     iddfile='Energy+.idd',  # type: Optional[str]
+                     commdct=None,  # type: Optional[Dict]
+                     block=None,  # type: Optional[List]
+                     cache_dir=None  # type: Optional[str]
+                     ):
+    # type: (...) -> Tuple[List, Eplusdata, List[Dict, Dict], Dict]
     """Read the idf file.
 
     This is patched so that the IDD index is not lost when reading a new IDF without reloading the modeleditor module.
@@ -128,6 +318,8 @@ def readdatacommdct1(idfname, iddfile='Energy+.idd', commdct=None, block=None):
     :param iddfile: Name of the IDD file to use to interpret the IDF.
     :param commdct: Descriptions of IDF fields from the IDD. Defaults to None.
     :param block: EnergyPlus field ID names of the IDF from the IDD. Defaults to None.
+    :param cache_dir: Directory for the on-disk cache of the parsed IDD. Defaults to the GEOMEPPY_IDD_CACHE
+        environment variable, if set.
     :returns: block EnergyPlus field ID names of the IDF from the IDD.
     :returns data: Eplusdata object containing representions of IDF objects.
     :returns: commdct List of names of IDF objects.
@@ -135,7 +327,7 @@ def readdatacommdct1(idfname, iddfile='Energy+.idd', commdct=None, block=None):
 
     """
     if not commdct:
-        block, commlst, commdct, idd_index = parse_idd.extractidddata(iddfile)
+        block, commdct, idd_index = idd_cache.extractidddata(iddfile, cache_dir)
         theidd = eplusdata.Idd(block, 2)
     else:
         theidd = eplusdata.Idd(block, 2)
@@ -175,30 +367,123 @@ def addthisbunch(bunchdt,  # type: Dict[str, Idf_MSequence]
 
 def makebunches(data,  # type: Eplusdata
                 commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optiona]]]]
-                theidf  # type: IDF
+                theidf,  # type: IDF
+                lazy=False,  # type: Optional[bool]
+                conv_keys=None  # type: Optional[Set[str]]
                 ):
-    # type: (...) -> Dict[str, Idf_MSequence]
+    # type: (...) -> Union[Dict[str, Idf_MSequence], LazyBunches]
     """Make bunches with data.
 
     :param data: Eplusdata object containing representions of IDF objects.
     :param commdct: Descriptions of IDF fields from the IDD.
     :param theidf: The IDF object.
+    :param lazy: If True, make the bunches for each object type only when that type is first accessed. Defaults to
+        False.
+    :param conv_keys: Object types to convert the fields of when they are first accessed, if `lazy` is True. Defaults
+        to None, which converts none.
     :returns: Dict of lists of idf_MSequence objects in the IDF.
 
     """
+    if lazy:
+        return LazyBunches(data, commdct, theidf, conv_keys)
     bunchdt = {}
-    dt, dtls = data.dt, data.dtls
-    for obj_i, key in enumerate(dtls):
+    for obj_i, key in enumerate(data.dtls):
         key = key.upper()
-        objs = dt[key]
-        list1 = []
-        for obj in objs:
-            bobj = makeabunch(commdct, obj, obj_i)
-            list1.append(bobj)
-        bunchdt[key] = Idf_MSequence(list1, objs, theidf)
+        bunchdt[key] = makebunchsequence(data, commdct, theidf, key, obj_i)
     return bunchdt
 
 
+def makebunchsequence(data,  # type: Eplusdata
+                      commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optiona]]]]
+                      theidf,  # type: IDF
+                      key,  # type: str
+                      obj_i  # type: int
+                      ):
+    # type: (...) -> Idf_MSequence
+    """Make the bunches for all objects of one type.
+
+    :param data: Eplusdata object containing representions of IDF objects.
+    :param commdct: Descriptions of IDF fields from the IDD.
+    :param theidf: The IDF object.
+    :param key: The upper case object type.
+    :param obj_i: Index of the object type in commdct.
+    :returns: An Idf_MSequence of the bunches, kept in sync with the objects in `data`.
+
+    """
+    objs = data.dt[key]
+    list1 = [makeabunch(commdct, obj, obj_i) for obj in objs]
+    return Idf_MSequence(list1, objs, theidf)
+
+
+class LazyBunches(MutableMapping):
+    """A dict of the Idf_MSequence for each object type, which makes the bunches for a type on first access.
+
+    All the object types are present as keys from the start, in the same order as from `makebunches`, so code which
+    iterates over the IDF objects still sees all of them. The fields of the types in `conv_keys` are converted to floats
+    and integers just before their bunches are made.
+
+    """
+
+    def __init__(self,
+                 data,  # type: Eplusdata
+                 commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optiona]]]]
+                 theidf,  # type: IDF
+                 conv_keys=None  # type: Optional[Set[str]]
+                 ):
+        # type: (...) -> None
+        self.data = data
+        self.commdct = commdct
+        self.theidf = theidf
+        self.conv_keys = conv_keys or set()
+        self._keys = [key.upper() for key in data.dtls]
+        self._bunches = {}  # type: Dict[str, Idf_MSequence]
+
+    def __getitem__(self, key):
+        # type: (str) -> Idf_MSequence
+        try:
+            return self._bunches[key]
+        except KeyError:
+            if key not in self._keys:
+                raise KeyError(key)
+            obj_i = getkeyindex(self.data)[key]
+            if key in self.conv_keys:
+                convertobjs(self.commdct[obj_i], self.data.dt[key])
+            bunches = makebunchsequence(self.data, self.commdct, self.theidf, key, obj_i)
+            self._bunches[key] = bunches
+            return bunches
+
+    def __setitem__(self, key, value):
+        # type: (str, Idf_MSequence) -> None
+        if key not in self._keys:
+            self._keys.append(key)
+        self._bunches[key] = value
+
+    def __delitem__(self, key):
+        # type: (str) -> None
+        if key not in self._keys:
+            raise KeyError(key)
+        self._keys.remove(key)
+        self._bunches.pop(key, None)
+
+    def __contains__(self, key):
+        # type: (Any) -> bool
+        return key in self._keys
+
+    def __iter__(self):
+        # type: () -> Iterator[str]
+        return iter(self._keys)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._keys)
+
+    @property
+    def materialized(self):
+        # type: () -> List[str]
+        """The object types which have had their bunches made."""
+        return [key for key in self._keys if key in self._bunches]
+
+
 def obj2bunch(data,  # type: Eplusdata
               commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optiona]]]]
               obj  # type: Union[List[Union[float, str]], List[str]]
@@ -212,13 +497,62 @@ def obj2bunch(data,  # type: Eplusdata
     :returns: EpBunch object.
 
     """
-    dtls = data.dtls
     key = obj[0].upper()
-    key_i = dtls.index(key)
+    try:
+        key_i = getkeyindex(data)[key]
+    except KeyError:
+        raise ValueError('{!r} is not in list'.format(key))
     abunch = makeabunch(commdct, obj, key_i)
     return abunch
 
 
+def getkeyindex(data):
+    # type: (Eplusdata) -> Dict[str, int]
+    """Get a lookup of the index of each object type in the IDD.
+
+    The lookup is built on first use and kept on the data object.
+
+    :param data: Eplusdata object containing representions of IDF objects.
+    :returns: Dict of the index in `data.dtls` of each upper case object type.
+    """
+    try:
+        return data.key_index
+    except AttributeError:
+        key_index = {}  # type: Dict[str, int]
+        for i, key in enumerate(data.dtls):
+            key_index.setdefault(key, i)
+        data.key_index = key_index
+        return key_index
+
+
+_field_names_cache = [None, {}]  # type: List[Any]
+
+
+def getfieldnames(commdct, obj_i):
+    # type: (List[Union[List[Dict[str, Any]], List[Dict[str, Optional[str]]]]], int) -> List[str]
+    """Get the field names for an object type.
+
+    The names are the same for every object of a type, so they are worked out once and shared by all the bunches of
+    that type. The cache is for a single IDD, and is cleared when it is called with a different commdct. Reading an IDF
+    can add extensible fields to commdct, so the names for a type are worked out again if its number of fields changes.
+
+    :param commdct: Descriptions of IDF fields from the IDD.
+    :param obj_i: Index of the object type in commdct.
+    :returns: List of the field names.
+    """
+    if _field_names_cache[0] is not commdct:
+        _field_names_cache[:] = [commdct, {}]
+    field_names = _field_names_cache[1]
+    obj_fields = field_names.get(obj_i)
+    if obj_fields is None or len(obj_fields) != len(commdct[obj_i]):
+        objfields = [comm.get('field') for comm in commdct[obj_i]]
+        objfields[0] = ['key']
+        objfields = [field[0] for field in objfields]
+        obj_fields = [bunchhelpers.makefieldname(field) for field in objfields]
+        field_names[obj_i] = obj_fields
+    return obj_fields
+
+
 def makeabunch(commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str, Optional[str]]]]]
                obj,  # type: Union[List[Union[float, str]], List[str]]
                obj_i  # type: int
@@ -233,14 +567,36 @@ def makeabunch(commdct,  # type: List[Union[List[Dict[str, Any]], List[Dict[str,
 
     """
     objidd = commdct[obj_i]
-    objfields = [comm.get('field') for comm in commdct[obj_i]]
-    objfields[0] = ['key']
-    objfields = [field[0] for field in objfields]
-    obj_fields = [bunchhelpers.makefieldname(field) for field in objfields]
+    obj_fields = getfieldnames(commdct, obj_i)
     bobj = EpBunch(obj, obj_fields, objidd)
     return bobj
 
 
+def setrawfields(obj,  # type: List[Any]
+                 field_names,  # type: List[str]
+                 fields  # type: Dict[str, Any]
+                 ):
+    # type: (...) -> List[Any]
+    """Set fields by name in a list of field values, as setting them on an EpBunch does.
+
+    :param obj: List of field values in an object.
+    :param field_names: The field names for the object type, from `getfieldnames`.
+    :param fields: A dict of `field: value`.
+    :returns: The list of field values, extended if needed.
+    :raises BadEPFieldError: If a field is not in the field names.
+
+    """
+    for name, value in fields.items():
+        try:
+            i = field_names.index(name)
+        except ValueError:
+            raise BadEPFieldError('unknown field %s' % (name,))
+        if i >= len(obj):
+            obj.extend([''] * (i + 1 - len(obj)))
+        obj[i] = value
+    return obj
+
+
 class IDF(BaseIDF):
     """Monkey-patched IDF.
 
@@ -248,16 +604,64 @@ class IDF(BaseIDF):
 
     """
 
-    def intersect_match(self):
-        # type: () -> None
-        """Intersect all surfaces in the IDF, then set boundary conditions."""
-        self.intersect()
+    idd_cache_dir = None  # type: Optional[str]
+    lazy = False
+    conv_keys = None  # type: Optional[Iterable[str]]
+
+    def __init__(self, idfname=None, epw=None, lazy=False, conv_keys=None):
+        # type: (Optional[Union[str, StringIO]], Optional[str], bool, Optional[Iterable[str]]) -> None
+        """
+        :param idfname: Path to an IDF file (which does not have to exist yet), or a file handle.
+        :param epw: File path to the EPW file to use if running the IDF.
+        :param lazy: If True, the EpBunch objects for an object type are only made when that type is first accessed
+            through `idfobjects`. This saves time and memory when a script only uses a few object types from a large
+            model. Defaults to False.
+        :param conv_keys: Object types to convert numeric fields to floats and integers for, for example
+            `GEOMETRY_KEYS`. Fields of other types are left as strings. Defaults to None, which converts all types.
+
+        """
+        self.lazy = lazy
+        self.conv_keys = conv_keys
+        self.geometry_generation = 0
+        self._extents = {}  # type: Dict[Tuple[Optional[str], ...], Tuple[Tuple[int, ...], np.ndarray, np.ndarray]]
+        super(IDF, self).__init__(idfname, epw)
+
+    @classmethod
+    def setiddname(cls, iddname, testing=False, cache_dir=None):
+        # type: (Union[str, StringIO], bool, Optional[str]) -> None
+        """Set the path to the EnergyPlus IDD for the version of EnergyPlus which is to be used by eppy.
+
+        :param iddname: Path to the IDD file.
+        :param testing: Flag to use if running tests since we may want to ignore the `IDDAlreadySetError`.
+        :param cache_dir: Directory for an on-disk cache of the parsed IDD, so that new processes can load it rather
+            than parse the IDD again. Defaults to the GEOMEPPY_IDD_CACHE environment variable, if set.
+
+        """
+        super(IDF, cls).setiddname(iddname, testing)
+        if cache_dir is not None:
+            cls.idd_cache_dir = cache_dir
+
+    def intersect_match(self, workers=None):
+        # type: (Optional[int]) -> None
+        """Intersect all surfaces in the IDF, then set boundary conditions.
+
+        :param workers: Number of processes to use for intersection. Default is None, meaning use this process.
+
+        """
+        self.intersect(workers)
         self.match()
 
-    def intersect(self):
-        # type: () -> None
-        """Intersect all surfaces in the IDF."""
-        intersect_idf_surfaces(self)
+    def intersect(self, workers=None):
+        # type: (Optional[int]) -> None
+        """Intersect all surfaces in the IDF.
+
+        Pairs of surfaces in different planes never interact, so with more than one worker the pairs are grouped by
+        plane and intersected in a pool of processes.
+
+        :param workers: Number of processes to use. Default is None, meaning use this process.
+
+        """
+        intersect_idf_surfaces(self, workers)
 
     def match(self):
         # type: () -> None
@@ -269,19 +673,28 @@ class IDF(BaseIDF):
         """Move an IDF close to the origin so that it can be viewed in SketchUp."""
         translate_to_origin(self)
 
-    def translate(self, vector):
-        # type: (Vector2D) -> None
+    def transform(self, normalize=True):
+        # type: (Optional[bool]) -> TransformContext
+        """Start a set of transformations to be applied to the IDF in a single pass.
+
+        :param normalize: False to skip normalising the order of vertices after a pure translation. Only use this if
+            the surfaces are already normalised. Default is True.
+        :returns: A TransformContext. Transformations are applied on calling its `commit` method, or at the end of a
+            `with` block.
+
+        """
+        return TransformContext(self, normalize=normalize)
+
+    def translate(self, vector, normalize=True):
+        # type: (Vector2D, Optional[bool]) -> None
         """Move the IDF in the direction given by a vector.
 
         :param vector: A vector to translate by.
+        :param normalize: False to keep the existing order of vertices, which is only correct if the surfaces are
+            already normalised. Default is True.
 
         """
-        surfaces = self.getsurfaces()
-        translate(surfaces, vector)
-        subsurfaces = self.getsubsurfaces()
-        translate(subsurfaces, vector)
-        shadingsurfaces = self.getshadingsurfaces()
-        translate(shadingsurfaces, vector)
+        self.transform(normalize).translate(vector).commit()
 
     def rotate(self, angle, anchor=None):
         # type: (Union[int, float], Optional[Union[Vector2D, Vector3D]]) -> None
@@ -291,15 +704,7 @@ class IDF(BaseIDF):
         :param anchor: Point around which to rotate. Default is the centre of the the IDF's bounding box.
 
         """
-        anchor = anchor or self.centroid
-        surfaces = self.getsurfaces()
-        subsurfaces = self.getsubsurfaces()
-        shadingsurfaces = self.getshadingsurfaces()
-        self.translate(-anchor)
-        rotate(surfaces, angle)
-        rotate(subsurfaces, angle)
-        rotate(shadingsurfaces, angle)
-        self.translate(anchor)
+        self.transform().rotate(angle, anchor).commit()
 
     def scale(self, factor, anchor=None):
         # type: (Union[int, float], Optional[Union[Vector2D, Vector3D]]) -> None
@@ -309,15 +714,17 @@ class IDF(BaseIDF):
         :param anchor: Point to scale around. Default is the centre of the the IDF's bounding box.
 
         """
-        anchor = anchor or self.centroid
-        surfaces = self.getsurfaces()
-        subsurfaces = self.getsubsurfaces()
-        shadingsurfaces = self.getshadingsurfaces()
-        self.translate(-anchor)
-        scale(surfaces, factor)
-        scale(subsurfaces, factor)
-        scale(shadingsurfaces, factor)
-        self.translate(anchor)
+        self.transform().scale(factor, anchor).commit()
+
+    def geometry_table(self, keys=GEOMETRY_KEYS):
+        # type: (Sequence[str]) -> GeometryTable
+        """Read the geometry of all surfaces in the IDF into arrays.
+
+        :param keys: IDF object types to include. Default is all detailed surfaces, subsurfaces and shading surfaces.
+        :returns: A GeometryTable with vertices, normals, distances, areas and bounding boxes for each surface.
+
+        """
+        return GeometryTable.from_idf(self, keys)
 
     def set_default_constructions(self):
         # type: () -> None
@@ -333,6 +740,42 @@ class IDF(BaseIDF):
         """
         return getidfsurfaces(self, surface_type)
 
+    def geometry_changed(self):
+        # type: () -> None
+        """Record that the geometry of the IDF has changed, so that cached extents are calculated again.
+
+        This is called when surfaces are added or removed through the IDF methods, their vertices are set with
+        `setcoords`, or their vertex fields or surface types are set by name. Surfaces added to or removed from
+        `idfobjects` directly are also noticed, since the cache is checked against the number of surfaces. It only needs
+        to be called directly after editing the field values in `obj` in place.
+
+        """
+        self.geometry_generation += 1
+
+    def extent(self, keys=GEOMETRY_KEYS, surface_type=None):
+        # type: (Sequence[str], Optional[str]) -> Tuple[np.ndarray, np.ndarray]
+        """Calculate the minimum and maximum corners of the box around a set of surfaces.
+
+        The result is cached until the geometry of the IDF or the number of surfaces of the given types changes.
+
+        :param keys: IDF object types to include. Default is all detailed surfaces, subsurfaces and shading surfaces.
+        :param surface_type: Only include surfaces with this surface type, e.g. 'floor'. Default is None, which includes
+            all surfaces.
+        :returns: Two (3,) arrays of the minimum and maximum x, y and z.
+
+        """
+        cache_key = tuple(key.upper() for key in keys) + (surface_type,)
+        sequences = [self.idfobjects[key] for key in cache_key[:-1]]
+        state = (self.geometry_generation,) + tuple(len(sequence) for sequence in sequences)
+        cached = self._extents.get(cache_key)
+        if cached is None or cached[0] != state:
+            surfaces = [s for sequence in sequences for s in sequence]
+            if surface_type:
+                surfaces = [s for s in surfaces if s.Surface_Type.lower() == surface_type.lower()]
+            cached = (state,) + surfaces_extent(surfaces)
+            self._extents[cache_key] = cached
+        return cached[1].copy(), cached[2].copy()
+
     def bounding_box(self):
         # type: () -> Polygon
         """Calculate the site bounding box.
@@ -340,23 +783,11 @@ class IDF(BaseIDF):
         :returns: A polygon of the bounding box.
 
         """
-        floors = self.getsurfaces('floor')
-        top_left = Vector2D(
-            min(min(Polygon(f.coords).xs) for f in floors),
-            max(max(Polygon(f.coords).ys) for f in floors)
-        )
-        bottom_left = Vector2D(
-            min(min(Polygon(f.coords).xs) for f in floors),
-            min(min(Polygon(f.coords).ys) for f in floors)
-        )
-        bottom_right = Vector2D(
-            max(max(Polygon(f.coords).xs) for f in floors),
-            min(min(Polygon(f.coords).ys) for f in floors)
-        )
-        top_right = Vector2D(
-            max(max(Polygon(f.coords).xs) for f in floors),
-            max(max(Polygon(f.coords).ys) for f in floors)
-        )
+        (min_x, min_y, _min_z), (max_x, max_y, _max_z) = self.extent(['BUILDINGSURFACE:DETAILED'], 'floor')
+        top_left = Vector2D(min_x, max_y)
+        bottom_left = Vector2D(min_x, min_y)
+        bottom_right = Vector2D(max_x, min_y)
+        top_right = Vector2D(max_x, max_y)
         return Polygon([top_left, bottom_left, bottom_right, top_right])
 
     @property
@@ -388,16 +819,28 @@ class IDF(BaseIDF):
         """
         return getidfshadingsurfaces(self, surface_type)
 
-    def set_wwr(self, wwr, construction=None, force=False):
-        # type: (float, Optional[str], Optional[bool]) -> None
-        """Add strip windows to all external walls.
+    def set_wwr(self,
+                wwr,  # type: float
+                construction=None,  # type: Optional[str]
+                force=False,  # type: Optional[bool]
+                wwr_map=None,  # type: Optional[Dict[Union[int, str], float]]
+                sill_height=None,  # type: Optional[float]
+                n_windows=1  # type: int
+                ):
+        # type: (...) -> None
+        """Add windows to all external walls.
 
         :param wwr: Window to wall ratio in the range 0.0 to 1.0.
         :param construction: Name of a window construction.
         :param force: True to remove all subsurfaces before setting the WWR.
+        :param wwr_map: Window to wall ratios for particular walls, keyed by either the wall name or the wall azimuth in
+            whole degrees clockwise from north. Walls not in the map use `wwr`.
+        :param sill_height: Height of the bottom of the windows above the bottom of the wall. Defaults to None, which
+            centres the windows vertically.
+        :param n_windows: Number of windows on each wall. Defaults to 1.
 
         """
-        set_wwr(self, wwr, construction, force)
+        set_wwr(self, wwr, construction, force, wwr_map, sill_height, n_windows)
 
     def view_model(self, test=False):
         # type: (Optional[bool]) -> None
@@ -471,6 +914,48 @@ class IDF(BaseIDF):
                 )
                 s.setcoords(surface_coords, ggr)
 
+    @classmethod
+    def iterobjects(cls, idfname, keys=None, conv=True):
+        # type: (Union[str, StringIO], Optional[Iterable[str]], Optional[bool]) -> Iterator[EpBunch]
+        """Read the objects in an IDF file one at a time, without reading the whole file into memory.
+
+        The IDD is read when this is called, if it has not been already. The objects returned are not part of an IDF,
+        so changes to them are not saved anywhere.
+
+        For example, to check the surfaces of a large model::
+
+            for surface in IDF.iterobjects('model.idf', keys=['BUILDINGSURFACE:DETAILED']):
+                check(surface.coords)
+
+        :param idfname: Path to the IDF file, or an open file handle.
+        :param keys: Object types to return. Defaults to None, which returns all objects.
+        :param conv: If True, convert strings to floats and integers where marked in the IDD. Defaults to True.
+        :returns: A generator of EpBunch objects.
+        :raises IDDNotSetError: If the IDD has not been set.
+
+        """
+        if cls.getiddname() is None:
+            errortxt = (
+                "IDD file needed to read the idf file. Set it using IDF.setiddname(iddfile)")
+            raise IDDNotSetError(errortxt)
+        if cls.idd_info is None:
+            block, commdct, idd_index, versiontuple = readidd(cls.iddname, cls.idd_cache_dir)
+            cls.setidd(commdct, idd_index, block, versiontuple)
+        dtls = eplusdata.Idd(cls.block, 2).dtls
+        return cls._iterobjects(idfname, dtls, keys, conv)
+
+    @classmethod
+    def _iterobjects(cls, idfname, dtls, keys, conv):
+        # type: (Union[str, StringIO], List[str], Optional[Iterable[str]], Optional[bool]) -> Iterator[EpBunch]
+        """The generator for `iterobjects`, kept separate so that the IDD is checked when `iterobjects` is called."""
+        if hasattr(idfname, 'read'):
+            for obj in iteridfobjects(idfname, cls.idd_info, dtls, keys, conv):
+                yield obj
+        else:
+            with open(idfname, 'rb') as fhandle:
+                for obj in iteridfobjects(fhandle, cls.idd_info, dtls, keys, conv):
+                    yield obj
+
     def read(self):
         # type: () -> None
         """Read the IDF file and the IDD file.
@@ -495,8 +980,12 @@ class IDF(BaseIDF):
             self,
             commdct=self.idd_info,
             block=self.block,
+            cache_dir=self.idd_cache_dir,
+            lazy=self.lazy,
+            conv_keys=self.conv_keys,
         )
         self.__class__.setidd(idd_info, idd_index, block, versiontuple)
+        self.geometry_changed()
 
     def newidfobject(self, key, aname='', **kwargs):
         # type: (str, str, **Any) -> EpBunch
@@ -527,8 +1016,80 @@ class IDF(BaseIDF):
         self.idfobjects[key].append(abunch)  # type: Dict[str, Idf_MSequence]
         for k, v in kwargs.items():
             abunch[k] = v
+        if key.upper() in GEOMETRY_KEYS:
+            self.geometry_changed()
         return abunch
 
+    def newidfobjects(self,
+                      key,  # type: str
+                      objects,  # type: Iterable[Dict[str, Any]]
+                      vertices=None  # type: Optional[Sequence[List[float]]]
+                      ):
+        # type: (...) -> List[EpBunch]
+        """Add several new idfobjects of the same type to the model.
+
+        This does the same as calling `newidfobject` for each set of field values, but the positions of the fields are
+        looked up once and the values are written straight into the new objects, which is much faster when adding
+        thousands of objects.
+
+        :param key: The type of IDF object. This must be in ALL_CAPS.
+        :param objects: A dict of `field: value` for each new object.
+        :param vertices: A flat list of coordinates, x1, y1, z1, x2,... zn, for each new object. These are written to
+            the vertex fields as they are, so they should already be in the order set by the global geometry rules.
+            Defaults to None, which leaves the vertex fields empty.
+        :returns: The new EpBunch objects.
+
+        """
+        key = key.upper()
+        try:
+            key_i = getkeyindex(self.model)[key]
+        except KeyError:
+            raise ValueError('{!r} is not in list'.format(key))
+        template = newrawobject(self.model, self.idd_info, key)
+        field_names = getfieldnames(self.idd_info, key_i)
+        first_x = field_names.index('Number_of_Vertices') + 1 if vertices is not None else None
+        objs = []
+        for i, fields in enumerate(objects):
+            obj = setrawfields(list(template), field_names, fields)
+            if first_x is not None:
+                obj = obj[:first_x] + [''] * (first_x - len(obj)) + list(vertices[i])
+            objs.append(obj)
+        bunches = [makeabunch(self.idd_info, obj, key_i) for obj in objs]
+        sequence = self.idfobjects[key]
+        for abunch in bunches:
+            abunch.theidf = self
+        sequence.list1.extend(bunches)
+        sequence.list2.extend(objs)
+        if key in GEOMETRY_KEYS:
+            self.geometry_changed()
+        return bunches
+
+    def removeidfobjects(self, idfobjects):
+        # type: (Iterable[EpBunch]) -> None
+        """Remove several IDF objects from the IDF.
+
+        This does the same as calling `removeidfobject` for each object, but in a single pass over each object type
+        rather than one search for each object. Objects are matched by identity, not by equality.
+
+        :param idfobjects: The IDF objects to remove.
+
+        """
+        by_key = {}  # type: Dict[str, Set[int]]
+        for idfobject in idfobjects:
+            by_key.setdefault(idfobject.key.upper(), set()).add(id(idfobject))
+        if any(key in GEOMETRY_KEYS for key in by_key):
+            self.geometry_changed()
+        for key, ids in by_key.items():
+            sequence = self.idfobjects[key]
+            keep = []
+            for i, idfobject in enumerate(sequence.list1):
+                if id(idfobject) in ids:
+                    idfobject.theidf = None
+                else:
+                    keep.append(i)
+            sequence.list1[:] = [sequence.list1[i] for i in keep]
+            sequence.list2[:] = [sequence.list2[i] for i in keep]
+
     def copyidfobject(self, idfobject):
         # type: (EpBunch) -> EpBunch
         """Add an IDF object to the IDF.
@@ -539,4 +1100,30 @@ class IDF(BaseIDF):
         :returns: EpBunch object.
 
         """
+        if idfobject.key.upper() in GEOMETRY_KEYS:
+            self.geometry_changed()
         return addthisbunch(self.idfobjects, self.model, self.idd_info, idfobject, self)
+
+    def removeidfobject(self, idfobject):
+        # type: (EpBunch) -> None
+        """Remove an IDF object from the IDF.
+
+        :param idfobject: The IDF object to remove.
+
+        """
+        if idfobject.key.upper() in GEOMETRY_KEYS:
+            self.geometry_changed()
+        super(IDF, self).removeidfobject(idfobject)
+
+    def popidfobject(self, key, index):
+        # type: (str, int) -> EpBunch
+        """Pop an IDF object from the IDF.
+
+        :param key: The type of IDF object. This must be in ALL_CAPS.
+        :param index: The index of the object to pop.
+        :returns: EpBunch object.
+
+        """
+        if key.upper() in GEOMETRY_KEYS:
+            self.geometry_changed()
+        return super(IDF, self).popidfobject(key, index)
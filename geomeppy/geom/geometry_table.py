@@ -0,0 +1,159 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""
+Columnar geometry for all the surfaces in an IDF.
+
+The vertices of every surface are read once into a flat array, with an array of offsets marking where each surface
+starts. Normals, plane distances, areas and bounding boxes are calculated for all surfaces in a few array operations.
+
+"""
+from typing import List, Optional, Sequence, Tuple, Union  # noqa
+
+from eppy.idf_msequence import Idf_MSequence  # noqa
+import numpy as np
+
+from .intersect_match import set_coords, set_vertex_fields
+from .kernels import areas, bounding_boxes, normal_vectors, pad_polygons, plane_distances
+from .polygons import Polygon3D
+
+MYPY = False
+if MYPY:
+    from ..eppy_patches import EpBunch, IDF  # noqa
+
+GEOMETRY_KEYS = (
+    'BUILDINGSURFACE:DETAILED',
+    'FENESTRATIONSURFACE:DETAILED',
+    'SHADING:SITE:DETAILED',
+    'SHADING:BUILDING:DETAILED',
+    'SHADING:ZONE:DETAILED',
+)
+
+
+class GeometryTable(object):
+    """Vertices and derived geometry of a list of surfaces, stored as arrays.
+
+    :ivar surfaces: The EpBunch objects in the table.
+    :ivar keys: The IDF object type of each surface.
+    :ivar names: The name of each surface.
+    :ivar vertices: An (N, 3) array of the vertices of all surfaces.
+    :ivar offsets: An (m + 1,) array where surface i has the vertices from offsets[i] to offsets[i + 1].
+    :ivar normals: An (m, 3) array of normal vectors.
+    :ivar distances: An (m,) array of plane distances.
+    :ivar areas: An (m,) array of surface areas.
+    :ivar mins: An (m, 3) array of the minimum corner of each bounding box.
+    :ivar maxs: An (m, 3) array of the maximum corner of each bounding box.
+
+    """
+
+    def __init__(self, surfaces):
+        # type: (Sequence[EpBunch]) -> None
+        self.surfaces = list(surfaces)
+        self.keys = [s.key.upper() for s in self.surfaces]
+        self.names = [s.Name for s in self.surfaces]
+        coords = [get_vertex_fields(s) for s in self.surfaces]
+        self.offsets = np.cumsum([0] + [len(c) // 3 for c in coords])
+        flat = [value for c in coords for value in c]
+        self.vertices = np.array(flat, dtype=float).reshape(-1, 3)
+        self._calculate()
+
+    @classmethod
+    def from_idf(cls, idf, keys=GEOMETRY_KEYS):
+        # type: (IDF, Sequence[str]) -> GeometryTable
+        """Read the geometry of all surfaces of the given types in an IDF.
+
+        :param idf: The IDF.
+        :param keys: IDF object types to include. Default is all detailed surfaces, subsurfaces and shading surfaces.
+        :returns: A GeometryTable.
+        """
+        surfaces = [s for key in keys for s in idf.idfobjects[key.upper()]]
+        return cls(surfaces)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.surfaces)
+
+    def _calculate(self):
+        # type: () -> None
+        """Calculate the derived geometry for all surfaces."""
+        padded, self.counts = pad_polygons(self.vertices, self.offsets)
+        self.normals = normal_vectors(padded)
+        self.distances = plane_distances(padded, self.normals)
+        self.areas = areas(padded)
+        self.mins, self.maxs = bounding_boxes(padded)
+
+    def coords(self, i):
+        # type: (int) -> np.ndarray
+        """The vertices of a surface.
+
+        :param i: Index of the surface.
+        :returns: An (n, 3) view into the vertex array.
+        """
+        return self.vertices[self.offsets[i]:self.offsets[i + 1]]
+
+    def polygon(self, i):
+        # type: (int) -> Polygon3D
+        """A polygon for a surface.
+
+        :param i: Index of the surface.
+        :returns: A Polygon3D.
+        """
+        return Polygon3D(self.coords(i))
+
+    def set_vertices(self, vertices):
+        # type: (np.ndarray) -> None
+        """Replace the vertices of all surfaces and recalculate the derived geometry.
+
+        The number of vertices in each surface must stay the same.
+
+        :param vertices: An (N, 3) array of the new vertices.
+        """
+        vertices = np.array(vertices, dtype=float)
+        if vertices.shape != self.vertices.shape:
+            raise ValueError('Expected vertices with shape %s, got %s' % (self.vertices.shape, vertices.shape))
+        self.vertices = vertices
+        self._calculate()
+
+    def write_back(self, ggr=None, normalize=True):
+        # type: (Union[List, None, Idf_MSequence], Optional[bool]) -> None
+        """Write the vertices back to the surfaces in the IDF.
+
+        :param ggr: Global geometry rules. Default is None.
+        :param normalize: True to order the vertices according to the global geometry rules, False to write them as
+            they are. Default is True.
+        """
+        for i, surface in enumerate(self.surfaces):
+            if normalize:
+                set_coords(surface, self.polygon(i), ggr)
+            else:
+                set_vertex_fields(surface, self.coords(i).ravel().tolist())
+
+
+def surfaces_extent(surfaces):
+    # type: (Sequence[EpBunch]) -> Tuple[np.ndarray, np.ndarray]
+    """Find the minimum and maximum corners of the box around a set of surfaces.
+
+    :param surfaces: The surfaces.
+    :returns: Two (3,) arrays of the minimum and maximum x, y and z.
+    :raises ValueError: If there are no vertices.
+    """
+    flat = [value for s in surfaces for value in get_vertex_fields(s)]
+    vertices = np.array(flat, dtype=float).reshape(-1, 3)
+    return vertices.min(axis=0), vertices.max(axis=0)
+
+
+def get_vertex_fields(surface):
+    # type: (EpBunch) -> List[float]
+    """Get the values of the vertex fields of a surface.
+
+    :param surface: The surface.
+    :returns: A flat list of coordinates, x1, y1, z1, x2,... zn.
+    """
+    first_x = surface.objls.index('Number_of_Vertices') + 1
+    values = surface.obj[first_x:]
+    while values and values[-1] == '':
+        values = values[:-1]
+    return values[:len(values) - len(values) % 3]
@@ -6,21 +6,58 @@
 # =======================================================================
 """Intersect and match all surfaces in an IDF.
 """
-from collections import defaultdict
-from itertools import combinations, product
-from typing import Dict, List, Optional, Union  # noqa
+from collections import Counter, defaultdict
+from itertools import product
+from typing import Dict, List, Optional, Tuple, Union  # noqa
 
 from eppy.idf_msequence import Idf_MSequence  # noqa
+import numpy as np  # noqa
 from numpy import float64  # noqa
+import pyclipper as pc
 
-from geomeppy.geom.polygons import break_polygons, Polygon3D
+from geomeppy.geom.polygons import break_polygons, clip_3D_polys, Polygon3D
+from geomeppy.geom.spatial_index import (
+    box_contains, boxes_overlap, candidate_pairs, cell_keys, fingerprint, PLANE_TOLERANCE, vertex_set_keys,
+)
+from geomeppy.geom.tolerance import arrays_isclose, isclose, vectors_isclose
 from geomeppy.geom.vectors import Vector3D
-from geomeppy.utilities import almostequal
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    # Python 2 needs the futures backport for parallel intersection
+    ProcessPoolExecutor = None
 
 MYPY = False
 if MYPY:
     from geomeppy.eppy_patches import EpBunch, IDF  # noqa
 
+# counts of the pairs of surfaces checked for adjacency, and the stage at which pairs without an intersection were found
+adjacency_stats = Counter()  # type: Counter
+
+
+def get_adjacency_stats():
+    # type: () -> Dict[str, int]
+    """Counts of how many pairs of surfaces were rejected at each stage before clipping.
+
+    - pruned: pairs never checked, since the spatial index showed they can't touch
+    - rejected_plane: pairs not in the same plane
+    - rejected_box: coplanar pairs whose 3D bounding boxes don't overlap
+    - rejected_extent: coplanar pairs whose projected 2D extents don't overlap
+    - clipped: pairs passed to pyclipper
+    - intersected: clipped pairs which intersect
+
+    :returns: A dict of counts since the last call to `reset_adjacency_stats`.
+    """
+    keys = ['pruned', 'rejected_plane', 'rejected_box', 'rejected_extent', 'clipped', 'intersected']
+    return {key: adjacency_stats[key] for key in keys}
+
+
+def reset_adjacency_stats():
+    # type: () -> None
+    """Set all the adjacency counts to zero."""
+    adjacency_stats.clear()
+
 
 def getidfplanes(surfaces):
     # type: (Idf_MSequence) -> Dict[float64, Dict[Vector3D, List[EpBunch]]]
@@ -51,50 +88,90 @@ def match_idf_surfaces(idf):
     :param idf: The IDF.
     """
     surfaces = getidfsurfaces(idf)
-    planes = getidfplanes(surfaces)
-    for distance in planes:
-        for vector in planes[distance]:
-            surfaces = planes[distance][vector]
-            matches = planes.get(-distance, {}).get(-vector, [])
-            if not matches:
-                # default set all the surfaces boundary conditions
-                for s in surfaces:
-                    set_unmatched_surface(s, vector)
+    polys = [Polygon3D(s.coords) for s in surfaces]
+    planes = getplanes(polys)
+    for (distance, vector), indices in planes.items():
+        opposite = planes.get((-distance, tuple(-axis for axis in vector)), [])
+        candidates = vertex_set_index(polys, opposite)
+        for i in indices:
+            j = find_match(polys, i, candidates)
+            if j is None:
+                set_unmatched_surface(surfaces[i], Vector3D(*vector), polys[i])
             else:
-                # check which are matches
-                for s in surfaces:
-                    for m in matches:
-                        matched = False
-                        poly1 = Polygon3D(s.coords)
-                        poly2 = Polygon3D(m.coords)
-                        if almostequal(poly1, poly2.invert_orientation()):
-                            matched = True
-                            # matched surfaces
-                            s.Outside_Boundary_Condition = 'surface'
-                            s.Outside_Boundary_Condition_Object = m.Name
-                            s.Sun_Exposure = 'NoSun'
-                            s.Wind_Exposure = 'NoWind'
-                            # matched surfaces
-                            m.Outside_Boundary_Condition = 'surface'
-                            m.Outside_Boundary_Condition_Object = s.Name
-                            m.Sun_Exposure = 'NoSun'
-                            m.Wind_Exposure = 'NoWind'
-                            break
-                    if not matched:
-                        # unmatched surfaces
-                        set_unmatched_surface(s, vector)
-                        set_unmatched_surface(m, vector)
-
-
-def set_unmatched_surface(surface, vector):
-    # type: (EpBunch, Vector3D) -> None
+                set_matched_surfaces(surfaces[i], surfaces[j])
+
+
+def getplanes(polys):
+    # type: (List[Polygon3D]) -> Dict[Tuple[float, Tuple[float, ...]], List[int]]
+    """Group polygons by plane, keyed by their rounded distance from the origin and rounded normal vector.
+
+    :param polys: A list of polygons.
+    :returns: Mapping of (distance, normal vector) to lists of indices into polys.
+    """
+    planes = {}  # type: Dict[Tuple[float, Tuple[float, ...]], List[int]]
+    for i, poly in enumerate(polys):
+        rounded_distance = round(poly.distance, 8)
+        rounded_normal_vector = tuple(round(axis, 8) for axis in poly.normal_vector)
+        planes.setdefault((rounded_distance, rounded_normal_vector), []).append(i)
+    return planes
+
+
+def vertex_set_index(polys, indices):
+    # type: (List[Polygon3D], List[int]) -> Dict[Tuple[int, ...], List[int]]
+    """Index polygons by a key which does not depend on the order of their vertices.
+
+    :param polys: A list of polygons.
+    :param indices: Indices of the polygons to index.
+    :returns: Mapping of vertex set keys to lists of indices into polys.
+    """
+    index = defaultdict(list)  # type: Dict[Tuple[int, ...], List[int]]
+    for i in indices:
+        index[vertex_set_keys(polys[i], tolerance=0)[0]].append(i)
+    return index
+
+
+def find_match(polys, i, candidates):
+    # type: (List[Polygon3D], int, Dict[Tuple[int, ...], List[int]]) -> Optional[int]
+    """Find the first polygon with the same vertices as a polygon, in the opposite order.
+
+    :param polys: A list of polygons.
+    :param i: Index of the polygon to match.
+    :param candidates: Polygons in the opposite plane, indexed by `vertex_set_index`.
+    :returns: The index of the matching polygon, or None if there is no match.
+    """
+    poly = polys[i]
+    possible = sorted({j for key in vertex_set_keys(poly) for j in candidates.get(key, [])})
+    for j in possible:
+        if arrays_isclose(poly.points_matrix, polys[j].points_matrix[::-1]):
+            return j
+    return None
+
+
+def set_matched_surfaces(surface, adjacent):
+    # type: (EpBunch, EpBunch) -> None
+    """Set boundary conditions for two surfaces which adjoin each other.
+
+    :param surface: The first surface.
+    :param adjacent: The second surface.
+    """
+    for s, other in [(surface, adjacent), (adjacent, surface)]:
+        s.Outside_Boundary_Condition = 'surface'
+        s.Outside_Boundary_Condition_Object = other.Name
+        s.Sun_Exposure = 'NoSun'
+        s.Wind_Exposure = 'NoWind'
+
+
+def set_unmatched_surface(surface, vector, poly=None):
+    # type: (EpBunch, Vector3D, Optional[Polygon3D]) -> None
     """Set boundary conditions for a surface which does not adjoin another one.
 
     :param surface: The surface.
     :param vector: The surface normal vector.
+    :param poly: A polygon of the surface, if one has already been made. Default is None.
     """
     surface.View_Factor_to_Ground = 'autocalculate'
-    poly = Polygon3D(surface.coords)
+    if poly is None:
+        poly = Polygon3D(surface.coords)
     if min(poly.zs) < 0 or all(z == 0 for z in poly.zs):
         # below ground or ground-adjacent surfaces
         surface.Outside_Boundary_Condition_Object = ''
@@ -105,18 +182,19 @@ def set_unmatched_surface(surface, vector):
         surface.Outside_Boundary_Condition = 'outdoors'
         surface.Outside_Boundary_Condition_Object = ''
         surface.Wind_Exposure = 'WindExposed'
-        if almostequal(vector, (0, 0, -1)):
+        if vectors_isclose(vector, (0, 0, -1)):
             # downward facing surfaces
             surface.Sun_Exposure = 'NoSun'
         else:
             surface.Sun_Exposure = 'SunExposed'  # other external surfaces
 
 
-def intersect_idf_surfaces(idf):
-    # type: (IDF) -> None
+def intersect_idf_surfaces(idf, workers=None):
+    # type: (IDF, Optional[int]) -> None
     """Intersect all surfaces in an IDF.
 
     :param idf: The IDF.
+    :param workers: Number of processes to use. Default is None, meaning intersect in this process.
     """
     surfaces = getidfsurfaces(idf)
     try:
@@ -124,7 +202,7 @@ def intersect_idf_surfaces(idf):
     except IndexError:
         ggr = None
     # get all the intersected surfaces
-    adjacencies = get_adjacencies(surfaces)
+    adjacencies = get_adjacencies(surfaces, workers)
     for surface in adjacencies:
         key, name = surface
         new_surfaces = adjacencies[surface]
@@ -136,17 +214,30 @@ def intersect_idf_surfaces(idf):
         idf.removeidfobject(old_obj)
 
 
-def get_adjacencies(surfaces):
-    # type: (Idf_MSequence) -> defaultdict
+def get_adjacencies(surfaces, workers=None):
+    # type: (Idf_MSequence, Optional[int]) -> defaultdict
     """Create a dictionary mapping surfaces to their adjacent surfaces.
 
+    Only pairs of surfaces which may be coplanar and have overlapping bounding boxes are checked.
+
     :param surfaces: A mutable list of surfaces.
+    :param workers: Number of processes to use. Default is None, meaning intersect in this process.
     :returns: Mapping of surfaces to adjacent surfaces.
     """
     adjacencies = defaultdict(list)
+    surfaces = list(surfaces)
+    polys = [Polygon3D(s.coords) for s in surfaces]
     # find all adjacent surfaces
-    for s1, s2 in combinations(surfaces, 2):
-        adjacencies = populate_adjacencies(adjacencies, s1, s2)
+    pairs = candidate_pairs(polys)
+    adjacency_stats['pruned'] += len(polys) * (len(polys) - 1) // 2 - len(pairs)
+    if workers and workers > 1:
+        results = parallel_adjacent_polygons(polys, pairs, workers)
+    else:
+        results = (adjacent_polygons(polys[i], polys[j]) for i, j in pairs)
+    for (i, j), result in zip(pairs, results):
+        if result:
+            adjacencies[(surfaces[i].key, surfaces[i].Name)] += result[0]
+            adjacencies[(surfaces[j].key, surfaces[j].Name)] += result[1]
     # make sure we have only unique surfaces
     for surface in adjacencies:
         adjacencies[surface] = unique(adjacencies[surface])
@@ -163,44 +254,160 @@ def populate_adjacencies(adjacencies, s1, s2):
     :param s2: Object representing an EnergyPlus surface.
     :returns: An updated dict of adjacencies.
     """
-    poly1 = Polygon3D(s1.coords)
-    poly2 = Polygon3D(s2.coords)
-    if not almostequal(abs(poly1.distance), abs(poly2.distance), 4):
-        return adjacencies
-    if not almostequal(poly1.normal_vector, poly2.normal_vector, 4):
-        if not almostequal(poly1.normal_vector, -poly2.normal_vector, 4):
-            return adjacencies
-
-    intersection = poly1.intersect(poly2)
-    if intersection:
-        new_surfaces = intersect(poly1, poly2)
-        new_s1 = [s for s in new_surfaces
-                  if almostequal(s.normal_vector, poly1.normal_vector, 4)]
-        new_s2 = [s for s in new_surfaces
-                  if almostequal(s.normal_vector, poly2.normal_vector, 4)]
-        adjacencies[(s1.key, s1.Name)] += new_s1
-        adjacencies[(s2.key, s2.Name)] += new_s2
+    result = adjacent_polygons(Polygon3D(s1.coords), Polygon3D(s2.coords))
+    if result:
+        adjacencies[(s1.key, s1.Name)] += result[0]
+        adjacencies[(s2.key, s2.Name)] += result[1]
     return adjacencies
 
 
-def intersect(poly1, poly2):
-    # type: (Polygon3D, Polygon3D) -> List[Polygon3D]
+def adjacent_polygons(poly1, poly2):
+    # type: (Polygon3D, Polygon3D) -> Optional[Tuple[List[Polygon3D], List[Polygon3D]]]
+    """Find the new polygons to replace two polygons which intersect.
+
+    :param poly1: The first polygon.
+    :param poly2: The second polygon.
+    :returns: None if the polygons don't intersect, otherwise lists of the new polygons for each of them.
+    """
+    n1, n2 = poly1._normal_vector(), poly2._normal_vector()
+    if not isclose(abs(poly1.distance), abs(poly2.distance), 4) or not (
+            vectors_isclose(n1, n2, 4) or vectors_isclose(n1, [-axis for axis in n2], 4)):
+        adjacency_stats['rejected_plane'] += 1
+        return None
+    if not boxes_overlap(poly1._bounds(), poly2._bounds(), PLANE_TOLERANCE):
+        adjacency_stats['rejected_box'] += 1
+        return None
+    if poly1.projection_axis == poly2.projection_axis and not boxes_overlap(
+            poly1._clipper_bounds(), poly2._clipper_bounds()):
+        adjacency_stats['rejected_extent'] += 1
+        return None
+
+    adjacency_stats['clipped'] += 1
+    clipped = clip_3D_polys(poly1, poly2, [pc.CT_INTERSECTION, pc.CT_DIFFERENCE])
+    if not clipped[0]:
+        return None
+    adjacency_stats['intersected'] += 1
+    new_surfaces = intersect(poly1, poly2, clipped)
+    new_s1 = [s for s in new_surfaces
+              if vectors_isclose(s._normal_vector(), n1, 4)]
+    new_s2 = [s for s in new_surfaces
+              if vectors_isclose(s._normal_vector(), n2, 4)]
+    return new_s1, new_s2
+
+
+def parallel_adjacent_polygons(polys, pairs, workers):
+    # type: (List[Polygon3D], List[Tuple[int, int]], int) -> List[Optional[Tuple[List[Polygon3D], List[Polygon3D]]]]
+    """Run `adjacent_polygons` on pairs of polygons in a pool of processes.
+
+    Pairs are grouped so that polygons which share a pair, and so are in the same plane, are sent to the same process.
+    Only vertex arrays are sent between processes.
+
+    :param polys: A list of polygons.
+    :param pairs: Pairs of indices into polys.
+    :param workers: Number of processes to use.
+    :returns: The result of `adjacent_polygons` for each pair, in the same order as pairs.
+    """
+    if ProcessPoolExecutor is None:
+        raise ImportError('Parallel intersection needs concurrent.futures. Install the futures package.')
+    tasks = []
+    for group in group_pairs(pairs, workers * 4):
+        indices = sorted({i for pair in group for i in pairs[pair]})
+        local = {i: n for n, i in enumerate(indices)}
+        tasks.append((group, (
+            [polys[i].points_matrix for i in indices],
+            [(local[pairs[pair][0]], local[pairs[pair][1]]) for pair in group],
+        )))
+    results = [None] * len(pairs)  # type: List[Optional[Tuple[List[Polygon3D], List[Polygon3D]]]]
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [(group, executor.submit(_adjacent_vertices, *task)) for group, task in tasks]
+        for group, future in futures:
+            group_results, stats = future.result()
+            adjacency_stats.update(stats)
+            for pair, result in zip(group, group_results):
+                if result:
+                    results[pair] = ([Polygon3D(v) for v in result[0]], [Polygon3D(v) for v in result[1]])
+    return results
+
+
+def group_pairs(pairs, n_groups):
+    # type: (List[Tuple[int, int]], int) -> List[List[int]]
+    """Split pairs into groups, keeping pairs which share a polygon in the same group.
+
+    Connected sets of pairs are assigned to groups largest first, each to the group with fewest pairs so far.
+
+    :param pairs: Pairs of indices.
+    :param n_groups: Maximum number of groups.
+    :returns: Lists of indices into pairs.
+    """
+    parents = {}  # type: Dict[int, int]
+
+    def find(i):
+        # type: (int) -> int
+        while parents.setdefault(i, i) != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in pairs:
+        parents[find(i)] = find(j)
+    components = defaultdict(list)  # type: Dict[int, List[int]]
+    for n, (i, _j) in enumerate(pairs):
+        components[find(i)].append(n)
+    groups = [[] for _ in range(n_groups)]  # type: List[List[int]]
+    for component in sorted(components.values(), key=len, reverse=True):
+        min(groups, key=len).extend(component)
+    return [sorted(group) for group in groups if group]
+
+
+def _adjacent_vertices(vertices, pairs):
+    # type: (List[np.ndarray], List[Tuple[int, int]]) -> Tuple[List[Optional[Tuple[List, List]]], Dict[str, int]]
+    """Run `adjacent_polygons` on pairs of polygons given as vertex arrays, in a worker process.
+
+    :param vertices: Vertex arrays of the polygons.
+    :param pairs: Pairs of indices into vertices.
+    :returns: The vertices of the result of `adjacent_polygons` for each pair, and the adjacency counts for this call.
+    """
+    polys = [Polygon3D(v) for v in vertices]
+    before = Counter(adjacency_stats)
+    results = []  # type: List[Optional[Tuple[List[np.ndarray], List[np.ndarray]]]]
+    for i, j in pairs:
+        result = adjacent_polygons(polys[i], polys[j])
+        if result:
+            result = ([p.points_matrix for p in result[0]], [p.points_matrix for p in result[1]])
+        results.append(result)
+    return results, dict(adjacency_stats - before)
+
+
+def intersect(poly1, poly2, clipped=None):
+    # type: (Polygon3D, Polygon3D, Optional[List[List[Polygon3D]]]) -> List[Polygon3D]
     """Calculate the polygons to represent the intersection of two polygons.
 
+    Each polygon is loaded into pyclipper once as the subject, and both the intersection and the difference are taken
+    from that one clipper.
+
     :param poly1: The first polygon.
     :param poly2: The second polygon.
+    :param clipped: The intersection and difference of poly1 with poly2 from `clip_3D_polys`, if already calculated.
     :returns: A list of unique polygons.
     """
-    polys = []
-    polys.extend(poly1.intersect(poly2))
-    polys.extend(poly2.intersect(poly1))
     if is_hole(poly1, poly2):
-        polys.extend(break_polygons(poly1, poly2))
+        hole = [poly1, poly2]
     elif is_hole(poly2, poly1):
-        polys.extend(break_polygons(poly2, poly1))
+        hole = [poly2, poly1]
     else:
-        polys.extend(poly1.difference(poly2))
-        polys.extend(poly2.difference(poly1))
+        hole = None
+    # the differences are only needed if neither polygon is a hole in the other
+    clip_types = [pc.CT_INTERSECTION] if hole else [pc.CT_INTERSECTION, pc.CT_DIFFERENCE]
+    forward = clipped or clip_3D_polys(poly1, poly2, clip_types)
+    backward = clip_3D_polys(poly2, poly1, clip_types)
+    polys = []
+    polys.extend(forward[0])
+    polys.extend(backward[0])
+    if hole:
+        polys.extend(break_polygons(*hole))
+    else:
+        polys.extend(forward[1])
+        polys.extend(backward[1])
     polys = unique(polys)
     return polys
 
@@ -219,10 +426,27 @@ def unique(polys):
         elif isinstance(item, list):
             flattened.extend(item)
 
-    results = []
+    results = []  # type: List[Polygon3D]
+    degenerate = []  # type: List[int]
+    fingerprints = {}  # type: Dict[Tuple[Tuple[int, ...], ...], int]
+    planes = defaultdict(list)  # type: Dict[Tuple[int, ...], List[int]]
     for poly in flattened:
-        if not any(poly == result for result in results):
-            results.append(poly)
+        try:
+            plane = [poly.distance] + list(poly.normal_vector)
+        except ZeroDivisionError:  # degenerate polygons have no plane, so only compare their vertices
+            if not any(arrays_isclose(poly.points_matrix, results[i].points_matrix) for i in degenerate):
+                degenerate.append(len(results))
+                results.append(poly)
+            continue
+        key = fingerprint(poly)
+        if key in fingerprints and poly == results[fingerprints[key]]:
+            continue  # the most likely duplicate is checked first
+        candidates = sorted({i for cell in cell_keys(plane) for i in planes[cell]})
+        if any(box_contains(results[i], poly) and poly == results[i] for i in candidates):
+            continue
+        fingerprints.setdefault(key, len(results))
+        planes[cell_keys(plane, tolerance=0)[0]].append(len(results))
+        results.append(poly)
 
     return results
 
@@ -262,13 +486,26 @@ def set_coords(surface,  # type: EpBunch
     """
     poly = Polygon3D(coords)
     poly = poly.normalize_coords(ggr)
-    coords = [i for vertex in poly for i in vertex]
+    coords = poly.points_matrix.ravel().tolist()
+    set_vertex_fields(surface, coords)
+
+
+def set_vertex_fields(surface, coords):
+    # type: (EpBunch, List[float]) -> None
+    """Write coordinates to the vertex fields of a surface without reordering them.
+
+    :param surface: The surface to modify.
+    :param coords: A flat list of coordinates, x1, y1, z1, x2,... zn.
+    """
     # find the vertex fields
     n_vertices_index = surface.objls.index('Number_of_Vertices')
     first_x = n_vertices_index + 1  # X of first coordinate
     surface.obj = surface.obj[:first_x]
     # set the vertex field values
     surface.fieldvalues.extend(coords)
+    idf = surface.theidf
+    if idf is not None and hasattr(idf, 'geometry_changed'):
+        idf.geometry_changed()
 
 
 def getidfsurfaces(idf, surface_type=None):
@@ -0,0 +1,125 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""
+Array kernels for polygon geometry.
+
+Each function works either on the vertices of a single polygon as an (n, 3) array, or on a batch of polygons as an
+(m, k, 3) array. Batches of polygons with different numbers of vertices are padded with copies of the first vertex of
+each polygon (see `pad_polygons`). Repeating the first vertex adds only zero-length edges, so normals, areas and
+bounding boxes are unaffected by the padding.
+
+"""
+from typing import Optional, Tuple  # noqa
+
+import numpy as np
+
+
+def pad_polygons(vertices, offsets):
+    # type: (np.ndarray, np.ndarray) -> Tuple[np.ndarray, np.ndarray]
+    """Convert a flat array of vertices into a padded batch of polygons.
+
+    :param vertices: An (N, 3) array of the vertices of all polygons.
+    :param offsets: An (m + 1,) array where polygon i has the vertices from offsets[i] to offsets[i + 1].
+    :returns: An (m, k, 3) array of polygons and an (m,) array of the number of vertices in each.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    offsets = np.asarray(offsets, dtype=int)
+    counts = np.diff(offsets)
+    if not len(vertices):
+        return np.zeros((len(counts), 1, 3)), counts
+    k = max(counts.max(), 1)
+    index = np.arange(k)
+    index = np.where(index < counts[:, None], index, 0) + offsets[:-1, None]
+    index = np.minimum(index, len(vertices) - 1)
+    return vertices[index], counts
+
+
+def newell_vectors(points):
+    # type: (np.ndarray) -> np.ndarray
+    """Sum of the cross products around a polygon, using Newell's Method.
+
+    This is perpendicular to the polygon in the outward direction, and its length is twice the polygon area.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :returns: A (3,) or (m, 3) array.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.shape[-2] == 0:
+        return np.zeros(points.shape[:-2] + (3,))
+    nxt = np.roll(points, -1, axis=-2)
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    x_n, y_n, z_n = nxt[..., 0], nxt[..., 1], nxt[..., 2]
+    n = np.stack([
+        ((y - y_n) * (z + z_n)).sum(axis=-1),
+        ((z - z_n) * (x + x_n)).sum(axis=-1),
+        ((x - x_n) * (y + y_n)).sum(axis=-1),
+    ], axis=-1)
+    return n
+
+
+def normal_vectors(points):
+    # type: (np.ndarray) -> np.ndarray
+    """Normal vectors of polygons, normalised so the absolute values of the components sum to one.
+
+    Degenerate polygons have a normal vector of zeros.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :returns: A (3,) or (m, 3) array.
+    """
+    n = newell_vectors(points)
+    magnitude = np.abs(n).sum(axis=-1, keepdims=True)
+    return n / np.where(magnitude == 0, 1.0, magnitude)
+
+
+def areas(points):
+    # type: (np.ndarray) -> np.ndarray
+    """Areas of polygons.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :returns: A scalar or an (m,) array.
+    """
+    return np.sqrt((newell_vectors(points) ** 2).sum(axis=-1)) / 2
+
+
+def centroids(points, counts=None):
+    # type: (np.ndarray, Optional[np.ndarray]) -> np.ndarray
+    """Mean position of the vertices of polygons.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :param counts: Number of vertices in each polygon of a padded batch. Default is None, meaning no padding.
+    :returns: A (3,) or (m, 3) array.
+    """
+    points = np.asarray(points, dtype=float)
+    if counts is None:
+        return points.mean(axis=-2)
+    mask = np.arange(points.shape[-2]) < np.asarray(counts)[:, None]
+    return (points * mask[..., None]).sum(axis=-2) / np.maximum(counts, 1)[:, None]
+
+
+def plane_distances(points, normals=None):
+    # type: (np.ndarray, Optional[np.ndarray]) -> np.ndarray
+    """Distances d where n . p = d is the equation of the plane of each polygon.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :param normals: Normal vectors of the polygons. Default is None, meaning they are calculated here.
+    :returns: A scalar or an (m,) array.
+    """
+    points = np.asarray(points, dtype=float)
+    if normals is None:
+        normals = normal_vectors(points)
+    return (normals * points[..., 0, :]).sum(axis=-1)
+
+
+def bounding_boxes(points):
+    # type: (np.ndarray) -> Tuple[np.ndarray, np.ndarray]
+    """Axis-aligned bounding boxes of polygons.
+
+    :param points: An (n, 3) or (m, k, 3) array of vertices.
+    :returns: Arrays of the minimum and maximum corners of each box.
+    """
+    points = np.asarray(points, dtype=float)
+    return points.min(axis=-2), points.max(axis=-2)
@@ -13,27 +13,42 @@ PyClipper is used for clipping.
 import pyclipper as pc
 from collections import MutableSequence
 from itertools import product
-from typing import Any, List, Tuple, Union  # noqa
+from typing import Any, Iterator, List, Sequence, Tuple, Union  # noqa
 
 import numpy as np
-from eppy.geometry.surface import area
 from eppy.idf_msequence import Idf_MSequence  # noqa
 from shapely import wkt
 
+from .kernels import areas, newell_vectors
 from .segments import Segment
-from .transformations import align_face, invert_align_face
+from .tolerance import isclose, vectors_isclose
+from .transformations import align_face, alignment_axes, invert_align_face
 from .vectors import normalise_vector, Vector2D, Vector3D
-from ..utilities import almostequal
+from ..utilities import memoized
+
+# whether each starting position is at the maximum (True) or minimum (False) of x', y' and z' in the plane of a surface
+STARTING_CORNERS = {
+    'upperleftcorner': (False, True, True),
+    'lowerleftcorner': (False, False, False),
+    'lowerrightcorner': (True, False, False),
+    'upperrightcorner': (True, True, True),
+}
 
 
 class Polygon(MutableSequence):
-    """Two-dimensional polygon."""
+    """Two-dimensional polygon.
+
+    Vertices are stored in a contiguous array of floats, and vector objects are only created when vertices are accessed
+    individually. Derived geometry such as the normal vector and area is cached until the vertices change.
+
+    """
     n_dims = 2
+    vector_class = Vector2D
 
     def __init__(self, vertices):
         # type: (Any) -> None
         super(Polygon, self).__init__()
-        self.vertices = [Vector2D(*v) for v in vertices]
+        self.vertices = vertices
 
     def __repr__(self):
         # type: () -> str
@@ -42,21 +57,35 @@ class Polygon(MutableSequence):
 
     def __len__(self):
         # type: () -> int
-        return len(self.vertices)
+        return len(self._points)
+
+    def __iter__(self):
+        # type: () -> Iterator
+        vector_class = self.vector_class
+        return (vector_class(*pt) for pt in self._points.tolist())
 
     def __delitem__(self, key):
-        del self.vertices[key]
+        self._points = np.delete(self._points, key, axis=0)
+        self._cache.clear()
 
     def __getitem__(self, key):
         # type: (Union[int, slice]) -> Any
-        return self.vertices[key]
+        if isinstance(key, slice):
+            return self.vertices[key]
+        return self.vector_class(*self._points[key].tolist())
 
     def __setitem__(self, key, value):
-        self.vertices[key] = value
+        if isinstance(key, slice):
+            vertices = self.vertices
+            vertices[key] = value
+            self.vertices = vertices
+        else:
+            self._points[key] = self._as_array([value])[0]
+            self._cache.clear()
 
     def __eq__(self, other):
         # type: (Polygon) -> bool
-        if self.__dict__ == other.__dict__:  # try the simple case first
+        if np.array_equal(self.points_matrix, other.points_matrix):  # try the simple case first
             return True
         else:  # also cover same shape in different rotation
             if self.difference(other):
@@ -124,8 +153,19 @@ class Polygon(MutableSequence):
     @property
     def normal_vector(self):
         # type: () -> Vector3D
+        """Vector perpendicular to the polygon in the outward direction.
+
+        Uses Newell's Method.
+
+        :returns: The normal vector.
+        """
+        return Vector3D(*self._normal_vector())
+
+    @memoized
+    def _normal_vector(self):
+        # type: () -> Tuple[float, float, float]
         as_3d = Polygon3D((v.x, v.y, 0) for v in self)
-        return as_3d.normal_vector
+        return as_3d._normal_vector()
 
     @property
     def bounding_box(self):
@@ -145,52 +185,95 @@ class Polygon(MutableSequence):
     def centroid(self):
         # type: () -> Vector2D
         """The centroid of a polygon."""
-        return Vector2D(
-            sum(self.xs) / len(self),
-            sum(self.ys) / len(self))
+        return Vector2D(*self._points[:, :2].mean(axis=0))
 
     def insert(self, key, value):
-        self.vertices.insert(key, value)
+        vertices = self.vertices
+        vertices.insert(key, value)
+        self.vertices = vertices
+
+    @property
+    def vertices(self):
+        # type: () -> List[Union[Vector2D, Vector3D]]
+        """A list of the vertices as vector objects.
+
+        These are created from the vertex array on each access, so changing them does not change the polygon.
+        """
+        return list(self)
+
+    @vertices.setter
+    def vertices(self, vertices):
+        # type: (Any) -> None
+        self._points = self._as_array(vertices)
+        self._cache = {}
+
+    def _as_array(self, vertices):
+        # type: (Any) -> np.ndarray
+        """Convert vertices to an (n, d) array of floats.
+
+        A 2D polygon keeps the width of the vertices it is given, so that 3D vertices can be added and compared as in a
+        3D polygon. A 3D polygon pads any missing z values with 0, and drops any extra columns, such as the homogeneous
+        coordinate from a `Transformation`.
+
+        :param vertices: An array, or an iterable of vectors or sequences of coordinates.
+        :returns: A new array.
+        """
+        if isinstance(vertices, np.ndarray) and vertices.ndim == 2 and vertices.shape[1] >= self.n_dims:
+            return np.array(vertices, dtype=float)
+        rows = [tuple(float(i) for i in v) for v in vertices]
+        if not rows:
+            return np.zeros((0, self.n_dims))
+        width = max(max(len(row) for row in rows), self.n_dims)
+        if any(len(row) != width for row in rows):
+            rows = [row + (0.0,) * (width - len(row)) for row in rows]
+        return np.array(rows, dtype=float)
 
     @property
     def points_matrix(self):
         # type: () -> np.ndarray
         """Matrix representing the points in a polygon.
 
+        This is a read-only view of the vertex array, not a copy.
+
         Format::
-            [[x1, x2,... xn]
-            [y1, y2,... yn]
-            [z1, z2,... zn]  # all 0 for 2D polygon
+            [[x1, y1, z1]
+            [x2, y2, z2]
+            ...
+            [xn, yn, zn]]  # no z column for a 2D polygon
 
         """
-        points = np.zeros((len(self.vertices), self.n_dims))
-        for i, v in enumerate(self.vertices):
-            points[i, :] = pt_to_array(v, dims=self.n_dims)
+        points = self._points[:, :self.n_dims]
+        points.flags.writeable = False
         return points
 
     @property
     def edges(self):
         # type: () -> List[Segment]
         """A list of edges represented as Segment objects."""
+        return list(self._edges())
+
+    @memoized
+    def _edges(self):
+        # type: () -> Tuple[Segment, ...]
         vertices = self.vertices
-        edges = [Segment(vertices[i], vertices[(i + 1) % len(self)])
-                 for i in range(len(self))]
+        edges = tuple(Segment(vertices[i], vertices[(i + 1) % len(self)])
+                      for i in range(len(self)))
         return edges
 
     @property
     def xs(self):
         # type: () -> List[float]
-        return [pt.x for pt in self.vertices]
+        return self._points[:, 0].tolist()
 
     @property
     def ys(self):
         # type: () -> List[float]
-        return [pt.y for pt in self.vertices]
+        return self._points[:, 1].tolist()
 
     @property
     def zs(self):
         # type: () -> List[float]
-        return [0.0] * len(self.vertices)
+        return [0.0] * len(self)
 
     @property
     def vertices_list(self):
@@ -199,12 +282,28 @@ class Polygon(MutableSequence):
 
         :returns: A list of tuples like [(x1, y1), (x2, y2),... (xn, yn)].
         """
-        return [pt_to_tuple(pt, dims=self.n_dims) for pt in self.vertices]
+        return [tuple(pt) for pt in self.points_matrix.tolist()]
+
+    @memoized
+    def _clipper_path(self):
+        # type: () -> List[List[int]]
+        """The vertices scaled to integers for pyclipper, cached until the vertices change."""
+        return pc.scale_to_clipper(self.vertices_list)
+
+    @memoized
+    def _bounds(self):
+        # type: () -> Tuple[np.ndarray, np.ndarray]
+        """The minimum and maximum corners of the axis-aligned bounding box, cached until the vertices change."""
+        return self.points_matrix.min(axis=0), self.points_matrix.max(axis=0)
 
     @property
+    @memoized
     def area(self):
         # type: () -> np.float64
-        return area(self)
+        points = self._points
+        if points.shape[1] < 3:
+            points = np.pad(points, ((0, 0), (0, 3 - points.shape[1])), 'constant')
+        return areas(points)
 
     def invert_orientation(self):
         # type: () -> Union[Polygon, Polygon3D]
@@ -214,7 +313,7 @@ class Polygon(MutableSequence):
 
         :returns: A polygon.
         """
-        return self.__class__(reversed(self.vertices))
+        return self.__class__(self._points[::-1])
 
     def project_to_3D(self, example3d):
         # type: (Polygon3D) -> Polygon3D
@@ -226,11 +325,10 @@ class Polygon(MutableSequence):
         :param example3D: A 3D polygon in the desired plane.
         :returns: A 3D polygon.
         """
-        points = self.points_matrix
         proj_axis = example3d.projection_axis
         a = example3d.distance
         v = example3d.normal_vector
-        projected_points = project_to_3D(points, proj_axis, a, v)
+        projected_points = project_to_3D(self.points_matrix, proj_axis, a, v)
         return Polygon3D(projected_points)
 
     def union(self, poly):
@@ -304,9 +402,9 @@ def break_polygons(poly, hole):
     union = hole.union(new_poly)
     union = union[0]
     new_poly2 = poly.difference(union)[0]
-    if not almostequal(new_poly.normal_vector, poly.normal_vector):
+    if not vectors_isclose(new_poly._normal_vector(), poly._normal_vector()):
         new_poly = new_poly.invert_orientation()
-    if not almostequal(new_poly2.normal_vector, poly.normal_vector):
+    if not vectors_isclose(new_poly2._normal_vector(), poly._normal_vector()):
         new_poly2 = new_poly2.invert_orientation()
 
     return [new_poly, new_poly2]
@@ -332,11 +430,9 @@ def prep_2D_polys(poly1, poly2):
     :param poly2: The clip polygon.
     :returns: A Pyclipper object.
     """
-    s1 = pc.scale_to_clipper(poly1.vertices_list)
-    s2 = pc.scale_to_clipper(poly2.vertices_list)
     clipper = pc.Pyclipper()
-    clipper.AddPath(s1, poly_type=pc.PT_SUBJECT, closed=True)
-    clipper.AddPath(s2, poly_type=pc.PT_CLIP, closed=True)
+    clipper.AddPath(poly1._clipper_path(), poly_type=pc.PT_SUBJECT, closed=True)
+    clipper.AddPath(poly2._clipper_path(), poly_type=pc.PT_CLIP, closed=True)
     return clipper
 
 
@@ -430,41 +526,37 @@ def process_clipped_2D_polys(results):
 class Polygon3D(Polygon):
     """Three-dimensional polygon."""
     n_dims = 3
-
-    def __init__(self, vertices):
-        # type: (Any) -> None
-        try:
-            self.vertices = [Vector3D(*v) for v in vertices]
-        except TypeError:
-            self.vertices = vertices
+    vector_class = Vector3D
 
     def __eq__(self, other):
         # type: (Polygon3D) -> bool
         # check they're in the same plane
-        if not almostequal(self.normal_vector, other.normal_vector):
+        if not vectors_isclose(self._normal_vector(), other._normal_vector()):
             return False
-        if not almostequal(self.distance, other.distance):
+        if not isclose(self.distance, other.distance):
             return False
         # if they are in the same plane, check they completely overlap in 2D
         return (self.project_to_2D() == other.project_to_2D())
 
+    def _as_array(self, vertices):
+        # type: (Any) -> np.ndarray
+        points = super(Polygon3D, self)._as_array(vertices)
+        if points.shape[1] > self.n_dims:
+            points = points[:, :self.n_dims].copy()
+        return points
+
     @property
     def zs(self):
         # type: () -> List[float]
-        return [pt.z for pt in self.vertices]
-
-    @property
-    def normal_vector(self):
-        # type: () -> Vector3D
-        """Vector perpendicular to the polygon in the outward direction.
-
-        Uses Newell's Method.
+        return self._points[:, 2].tolist()
 
-        :returns: The normal vector.
-        """
-        return Vector3D(*normal_vector(self.vertices))
+    @memoized
+    def _normal_vector(self):
+        # type: () -> Tuple[float, float, float]
+        return tuple(normal_vector(self))
 
     @property
+    @memoized
     def distance(self):
         # type: () -> np.float64
         """
@@ -473,19 +565,21 @@ class Polygon3D(Polygon):
 
         :returns: The distance from the origin to the polygon.
         """
-        v = self.normal_vector
-        pt = self.points_matrix[0]  # arbitrary point in the polygon
+        v = self._normal_vector()
+        pt = self._points[0]  # arbitrary point in the polygon
         d = np.dot(v, pt)
         return d
 
     @property
+    @memoized
     def projection_axis(self):
         # type: () -> int
         """An axis which will not lead to a degenerate surface.
 
         :returns: The axis index.
         """
-        proj_axis = max(range(3), key=lambda i: abs(self.normal_vector[i]))
+        v = self._normal_vector()
+        proj_axis = max(range(3), key=lambda i: abs(v[i]))
         return proj_axis
 
     @property
@@ -495,7 +589,7 @@ class Polygon3D(Polygon):
 
         :returns: True if the polygon is in the xy plane, else False.
         """
-        return np.array(self.zs).std() < 1e-8
+        return self._points[:, 2].std() < 1e-8
 
     def is_clockwise(self, viewpoint):
         # type: (Vector3D) -> np.bool_
@@ -506,7 +600,7 @@ class Polygon3D(Polygon):
         :param viewpoint: A point from which to view the polygon.
         :returns: True if vertices are ordered clockwise when observed from the given viewpoint.
         """
-        arbitrary_pt = self.vertices[0]
+        arbitrary_pt = self[0]
         v = arbitrary_pt - viewpoint
         n = self.normal_vector
         sign = np.dot(v, n)
@@ -521,14 +615,14 @@ class Polygon3D(Polygon):
         :param other: Another polygon.
         :returns: True if the two polygons are coplanar, else False.
         """
-        n1 = self.normal_vector
-        n2 = other.normal_vector
+        n1 = self._normal_vector()
+        n2 = other._normal_vector()
         d1 = self.distance
         d2 = other.distance
 
-        if (almostequal(n1, n2) and almostequal(d1, d2)):
+        if (vectors_isclose(n1, n2) and isclose(d1, d2)):
             return True
-        elif (almostequal(n1, -n2) and almostequal(d1, -d2)):
+        elif (vectors_isclose(n1, [-axis for axis in n2]) and isclose(d1, -d2)):
             return True
         else:
             return False
@@ -542,10 +636,7 @@ class Polygon3D(Polygon):
         Vector3D
 
         """
-        return Vector3D(
-            sum(self.xs) / len(self),
-            sum(self.ys) / len(self),
-            sum(self.zs) / len(self))
+        return Vector3D(*self._points.mean(axis=0))
 
     def outside_point(self, entry_direction='counterclockwise'):
         # type: (str) -> Vector3D
@@ -567,9 +658,9 @@ class Polygon3D(Polygon):
         """
         entry_direction = entry_direction.lower()
         if entry_direction == 'clockwise':
-            inside = self.vertices[0] - self.normal_vector
+            inside = self[0] - self.normal_vector
         elif entry_direction == 'counterclockwise':
-            inside = self.vertices[0] + self.normal_vector
+            inside = self[0] + self.normal_vector
         else:
             raise ValueError("invalid value for entry_direction '%s'" %
                              entry_direction)
@@ -590,22 +681,34 @@ class Polygon3D(Polygon):
         Polygon3D
 
         """
-        if starting_position == 'upperleftcorner':
-            bbox_corner = self.bounding_box[0]
-        elif starting_position == 'lowerleftcorner':
-            bbox_corner = self.bounding_box[1]
-        elif starting_position == 'lowerrightcorner':
-            bbox_corner = self.bounding_box[2]
-        elif starting_position == 'upperrightcorner':
-            bbox_corner = self.bounding_box[3]
-        else:
+        try:
+            upper = STARTING_CORNERS[starting_position]
+        except KeyError:
             raise ValueError(
                 '%s is not a valid starting position' % starting_position)
-        start_index = self.index(bbox_corner.closest(self))
-        new_vertices = [self[(start_index + i) % len(self)]
-                        for i in range(len(self))]
+        # find the corner of the bounding box in the plane of the polygon, and the closest vertex to it
+        local = np.dot(self.points_matrix, alignment_axes(self._normal_vector()).T)
+        corner = np.where(upper, local.max(axis=0), local.min(axis=0))
+        start_index = int(np.argmin(((local - corner) ** 2).sum(axis=1)))
 
-        return Polygon3D(new_vertices)
+        return Polygon3D(np.roll(self._points, -start_index, axis=0))
+
+    @memoized
+    def _clipper_path(self):
+        # type: () -> List[List[int]]
+        """The vertices projected into 2D and scaled to integers for pyclipper, cached until the vertices change.
+
+        The parameters to project results back into 3D (the normal vector, distance and projection axis) are also
+        cached on the polygon.
+        """
+        return self.project_to_2D()._clipper_path()
+
+    @memoized
+    def _clipper_bounds(self):
+        # type: () -> Tuple[np.ndarray, np.ndarray]
+        """The minimum and maximum corners of the projected extent in pyclipper's scaled integers."""
+        path = np.array(self._clipper_path(), dtype=np.int64)
+        return path.min(axis=0), path.max(axis=0)
 
     def project_to_2D(self):
         # type: () -> Polygon
@@ -621,10 +724,9 @@ class Polygon3D(Polygon):
         Polygon3D
 
         """
-        points = self.points_matrix
-        projected_points = project_to_2D(points, self.projection_axis)
+        projected_points = project_to_2D(self.points_matrix, self.projection_axis)
 
-        return Polygon([pt[:2] for pt in projected_points])
+        return Polygon(projected_points)
 
     def union(self, poly):
         # type: (Polygon3D) -> List[Polygon3D]
@@ -703,7 +805,7 @@ class Polygon3D(Polygon):
 
 
 def normal_vector(poly):
-    # type: (List[Vector3D]) -> List[float]
+    # type: (Union[Polygon3D, List[Vector3D]]) -> List[float]
     """Return the unit normal vector of a polygon.
 
     We use Newell's Method since the cross-product of two edge vectors is not
@@ -712,15 +814,24 @@ def normal_vector(poly):
 
     Parameters
     ----------
+    poly : Polygon3D or list
+        The polygon, or a list of its vertices.
 
-    """
-    n = [0.0, 0.0, 0.0]
+    Returns
+    -------
+    list
 
-    for i, v_curr in enumerate(poly):
-        v_next = poly[(i + 1) % len(poly)]
-        n[0] += (v_curr.y - v_next.y) * (v_curr.z + v_next.z)
-        n[1] += (v_curr.z - v_next.z) * (v_curr.x + v_next.x)
-        n[2] += (v_curr.x - v_next.x) * (v_curr.y + v_next.y)
+    Raises
+    ------
+    ZeroDivisionError
+        If the polygon is degenerate.
+
+    """
+    try:
+        points = poly.points_matrix
+    except AttributeError:
+        points = [(v[0], v[1], v[2]) for v in poly]
+    n = newell_vectors(points).tolist()
 
     return normalise_vector(n)
 
@@ -743,21 +854,18 @@ def prep_3D_polys(poly1, poly2):
     """
     if not poly1.is_coplanar(poly2):
         return False
-    poly1 = poly1.project_to_2D()
-    poly2 = poly2.project_to_2D()
-
-    s1 = pc.scale_to_clipper(poly1.vertices_list)
-    s2 = pc.scale_to_clipper(poly2.vertices_list)
     clipper = pc.Pyclipper()
-    clipper.AddPath(s1, poly_type=pc.PT_SUBJECT, closed=True)
-    clipper.AddPath(s2, poly_type=pc.PT_CLIP, closed=True)
+    clipper.AddPath(poly1._clipper_path(), poly_type=pc.PT_SUBJECT, closed=True)
+    clipper.AddPath(poly2._clipper_path(), poly_type=pc.PT_CLIP, closed=True)
 
     return clipper
 
 
-def union_3D_polys(poly1, poly2):
-    # type: (Polygon3D, Polygon3D) -> List[Polygon3D]
-    """Union of two 3D polygons.
+def clip_3D_polys(poly1, poly2, clip_types):
+    # type: (Polygon3D, Polygon3D, Sequence[int]) -> List[List[Polygon3D]]
+    """Run several clipping operations on two 3D polygons.
+
+    The polygons are projected and loaded into pyclipper once, then each operation is a further call to Execute.
 
     Parameters
     ----------
@@ -765,30 +873,47 @@ def union_3D_polys(poly1, poly2):
         The subject polygon.
     poly2 : Polygon3D
         The clip polygon.
+    clip_types : list
+        Pyclipper clip types, e.g. [pc.CT_INTERSECTION, pc.CT_DIFFERENCE].
 
     Returns
     -------
-    list or False
-        A list of lists of Polygon3D objects representing each union.
+    list
+        A list of Polygon3D objects for each clip type, oriented to match poly1.
 
     """
     clipper = prep_3D_polys(poly1, poly2)
     if not clipper:
-        return []
-    unions = clipper.Execute(
-        pc.CT_UNION, pc.PFT_NONZERO, pc.PFT_NONZERO)
+        return [[] for _clip_type in clip_types]
+    results = []
+    for clip_type in clip_types:
+        clipped = clipper.Execute(clip_type, pc.PFT_NONZERO, pc.PFT_NONZERO)
+        polys = process_clipped_3D_polys(clipped, poly1)
+        # orient to match poly1
+        results.append([
+            poly if vectors_isclose(poly._normal_vector(), poly1._normal_vector()) else poly.invert_orientation()
+            for poly in polys])
+    return results
 
-    polys = process_clipped_3D_polys(unions, poly1)
 
-    # orient to match poly1
-    results = []
-    for poly in polys:
-        if almostequal(poly.normal_vector, poly1.normal_vector):
-            results.append(poly)
-        else:
-            results.append(poly.invert_orientation())
+def union_3D_polys(poly1, poly2):
+    # type: (Polygon3D, Polygon3D) -> List[Polygon3D]
+    """Union of two 3D polygons.
 
-    return results
+    Parameters
+    ----------
+    poly1 : Polygon3D
+        The subject polygon.
+    poly2 : Polygon3D
+        The clip polygon.
+
+    Returns
+    -------
+    list or False
+        A list of lists of Polygon3D objects representing each union.
+
+    """
+    return clip_3D_polys(poly1, poly2, [pc.CT_UNION])[0]
 
 
 def intersect_3D_polys(poly1, poly2):
@@ -809,22 +934,7 @@ def intersect_3D_polys(poly1, poly2):
         objects representing each intersection.
 
     """
-    clipper = prep_3D_polys(poly1, poly2)
-    if not clipper:
-        return []
-    intersections = clipper.Execute(
-        pc.CT_INTERSECTION, pc.PFT_NONZERO, pc.PFT_NONZERO)
-
-    polys = process_clipped_3D_polys(intersections, poly1)
-    # orient to match poly1
-    results = []
-    for poly in polys:
-        if almostequal(poly.normal_vector, poly1.normal_vector):
-            results.append(poly)
-        else:
-            results.append(poly.invert_orientation())
-
-    return results
+    return clip_3D_polys(poly1, poly2, [pc.CT_INTERSECTION])[0]
 
 
 def difference_3D_polys(poly1, poly2):
@@ -845,23 +955,7 @@ def difference_3D_polys(poly1, poly2):
         objects representing each difference.
 
     """
-    clipper = prep_3D_polys(poly1, poly2)
-    if not clipper:
-        return []
-    differences = clipper.Execute(
-        pc.CT_DIFFERENCE, pc.PFT_NONZERO, pc.PFT_NONZERO)
-
-    polys = process_clipped_3D_polys(differences, poly1)
-
-    # orient to match poly1
-    results = []
-    for poly in polys:
-        if almostequal(poly.normal_vector, poly1.normal_vector):
-            results.append(poly)
-        else:
-            results.append(poly.invert_orientation())
-
-    return results
+    return clip_3D_polys(poly1, poly2, [pc.CT_DIFFERENCE])[0]
 
 
 def process_clipped_3D_polys(results, example3d):
@@ -887,28 +981,23 @@ def process_clipped_3D_polys(results, example3d):
 
 
 def project_to_2D(vertices, proj_axis):
-    # type: (np.ndarray, int) -> List[Tuple[np.float64, np.float64]]
+    # type: (np.ndarray, int) -> np.ndarray
     """Project a 3D polygon into 2D space.
 
     Parameters
     ----------
-    vertices : list
+    vertices : np.ndarray
         The three-dimensional vertices of the polygon.
     proj_axis : int
         The axis to project into.
-    a : float
-        Distance to the origin for the plane to project into.
-    v : list
-        Normal vector of the plane to project into.
 
     Returns
     -------
-    list
+    np.ndarray
         The transformed vertices.
 
     """
-    points = [project(x, proj_axis) for x in vertices]
-    return points
+    return np.delete(np.asarray(vertices, dtype=float), proj_axis, axis=1)
 
 
 def project(pt, proj_axis):
@@ -928,12 +1017,12 @@ def project_to_3D(vertices,  # type: np.ndarray
                   a,  # type: np.float64
                   v  # type: Vector3D
                   ):
-    # type: (...) -> List[Tuple[np.float64, np.float64, np.float64]]
+    # type: (...) -> np.ndarray
     """Project a 2D polygon into 3D space.
 
     Parameters
     ----------
-    vertices : list
+    vertices : np.ndarray
         The two-dimensional vertices of the polygon.
     proj_axis : int
         The axis to project into.
@@ -944,11 +1033,17 @@ def project_to_3D(vertices,  # type: np.ndarray
 
     Returns
     -------
-    list
+    np.ndarray
         The transformed vertices.
 
     """
-    return [project_inv(pt, proj_axis, a, v) for pt in vertices]
+    w = np.insert(np.asarray(vertices, dtype=float), proj_axis, 0.0, axis=1)
+    c = np.full(len(w), a, dtype=float)
+    for i in range(3):
+        c -= w[:, i] * v[i]
+    c /= v[proj_axis]
+    w[:, proj_axis] = c
+    return w
 
 
 def project_inv(pt,  # type: np.ndarray
@@ -989,63 +1084,6 @@ def project_inv(pt,  # type: np.ndarray
     return tuple(w)
 
 
-def pt_to_tuple(pt, dims=3):
-    # type: (Union[Vector2D, Vector3D], int) -> Tuple[float, ]
-    """Convert a point to a numpy array.
-
-    Convert a Vector3D to an (x,y,z) tuple or a Vector2D to an (x,y) tuple.
-    Ensures all values are floats since some other types cause problems in
-    pyclipper (notably where sympy.Zero is used to represent 0.0).
-
-    Parameters
-    ----------
-    pt : sympy.Vector3D, sympy.Vector2D
-        The point to convert.
-    dims : int, optional
-        Number of dimensions {default : 3}.
-
-    Returns
-    -------
-    tuple
-
-    """
-    # handle Vector3D
-    if dims == 3:
-        return float(pt.x), float(pt.y), float(pt.z)
-    # handle Vector2D
-    elif dims == 2:
-        return float(pt.x), float(pt.y)
-
-
-def pt_to_array(pt, dims=3):
-    # type: (Union[Vector2D, Vector3D], int) -> np.ndarray
-    """Convert a point to a numpy array.
-
-    Converts a Vector3D to a numpy.array([x,y,z]) or a Vector2D to a
-    numpy.array([x,y]).
-    Ensures all values are floats since some other types cause problems in
-    pyclipper (notably where sympy.Zero is used to represent 0.0).
-
-    Parameters
-    ----------
-    pt : sympy.Vector3D
-        The point to convert.
-    dims : int, optional
-        Number of dimensions {default : 3}.
-
-    Returns
-    -------
-    numpy.np.ndarray
-
-    """
-    # handle Vector3D
-    if dims == 3:
-        return np.array([float(pt.x), float(pt.y), float(pt.z)])
-    # handle Vector2D
-    elif dims == 2:
-        return np.array([float(pt.x), float(pt.y)])
-
-
 def normalize_coords(poly,  # type: Polygon3D
                      outside_pt,  # type: Vector3D
                      ggr=None  # type: Union[List, None, Idf_MSequence]
@@ -11,8 +11,8 @@ Segment class, representing a line segment.
 
 from typing import Iterator  # noqa
 
-from .vectors import Vector3D
-from ..utilities import almostequal
+from .tolerance import vectors_isclose
+from .vectors import Vector3D  # noqa
 
 MYPY = False
 if MYPY:
@@ -52,17 +52,19 @@ class Segment(object):
         :param other: The other segment.
         :return: True if the segments are collinear else False.
         """
-        if almostequal(other, self) or almostequal(other, -self):
+        if vectors_isclose(other.p1, self.p1) and vectors_isclose(other.p2, self.p2):
+            return True
+        if vectors_isclose(other.p1, self.p2) and vectors_isclose(other.p2, self.p1):
             return True
         a = self.p1 - other.p1
         b = self.p1 - other.p2
         angle_between = a.cross(b)
-        if almostequal(angle_between, Vector3D(0, 0, 0)):
+        if vectors_isclose(angle_between, (0, 0, 0)):
             return True
         a = self.p2 - other.p1
         b = self.p2 - other.p2
         angle_between = a.cross(b)
-        if almostequal(angle_between, Vector3D(0, 0, 0)):
+        if vectors_isclose(angle_between, (0, 0, 0)):
             return True
         return False
 
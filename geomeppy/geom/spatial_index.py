@@ -0,0 +1,201 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""
+Spatial indexing to find the pairs of surfaces which may intersect.
+
+Surfaces are first bucketed by plane, using the absolute plane distance and the absolute components of the normal
+vector so that surfaces facing in opposite directions share a bucket. Each bucket is then pruned with a sweep and prune
+over axis-aligned bounding boxes. Only the surviving pairs need to be passed to the clipping code.
+
+Polygons can also be given a fingerprint, a hashable key built from their vertices snapped to a fine grid, so that
+duplicate polygons can be found by dictionary lookup rather than by clipping.
+
+"""
+from collections import defaultdict
+from itertools import product
+from typing import Dict, Iterable, List, Set, Tuple  # noqa
+
+import numpy as np
+
+from . import kernels
+from .kernels import pad_polygons
+
+MYPY = False
+if MYPY:
+    from .polygons import Polygon3D  # noqa
+
+PLANE_TOLERANCE = 1e-4  # looser than the 4 decimal places used to compare planes in populate_adjacencies
+CELL_SIZE = 1e-3
+VERTEX_CELL_SIZE = 1e-6
+VERTEX_TOLERANCE = 1e-6  # looser than the 7 decimal places used to compare vertices when matching surfaces
+
+
+def cell_keys(values, tolerance=PLANE_TOLERANCE, cell_size=CELL_SIZE):
+    # type: (Iterable[float], float, float) -> List[Tuple[int, ...]]
+    """Find all the grid cells that values within a tolerance of the given values may fall in.
+
+    Any two sets of values which are equal within the tolerance are guaranteed to share at least one cell key.
+
+    :param values: Coordinates of a point in any number of dimensions.
+    :param tolerance: Maximum difference between values to be considered equal.
+    :param cell_size: Size of each grid cell. This must be more than twice the tolerance.
+    :returns: A list of cell keys.
+    """
+    options = []
+    for value in values:
+        cell = int(np.floor(value / cell_size))
+        cells = [cell]
+        if value - tolerance < cell * cell_size:
+            cells.append(cell - 1)
+        if value + tolerance >= (cell + 1) * cell_size:
+            cells.append(cell + 1)
+        options.append(cells)
+    return list(product(*options))
+
+
+def plane_key_values(poly):
+    # type: (Polygon3D) -> List[float]
+    """Values which are equal for coplanar polygons, whichever direction they face.
+
+    :param poly: A polygon.
+    :returns: The absolute distance and absolute normal vector components.
+    """
+    return [abs(poly.distance)] + [abs(axis) for axis in poly.normal_vector]
+
+
+def fingerprint(poly, cell_size=VERTEX_CELL_SIZE):
+    # type: (Polygon3D, float) -> Tuple[Tuple[int, ...], ...]
+    """A hashable key for the vertex ring of a polygon.
+
+    Vertices are snapped to a grid, and the ring is rotated to start from the smallest snapped vertex so the key does
+    not depend on which vertex is first. Polygons with the same key have the same vertices in the same order to within
+    the cell size, and so are in the same plane and face the same way. Polygons which are almost equal may still have
+    different keys if their vertices fall either side of a cell boundary.
+
+    :param poly: A polygon.
+    :param cell_size: Size of each grid cell.
+    :returns: A tuple of snapped vertices.
+    """
+    ring = [tuple(row) for row in np.round(poly.points_matrix / cell_size).astype(np.int64).tolist()]
+    if not ring:
+        return ()
+    start = ring.index(min(ring))
+    return tuple(ring[start:] + ring[:start])
+
+
+def vertex_set_keys(poly, tolerance=VERTEX_TOLERANCE, cell_size=CELL_SIZE):
+    # type: (Polygon3D, float, float) -> List[Tuple[int, ...]]
+    """Keys which do not depend on the order or orientation of the vertices of a polygon.
+
+    The keys are the number of vertices and the grid cells the centroid may fall in. Any two polygons with the same
+    vertices, to within the tolerance, share at least one key.
+
+    :param poly: A polygon.
+    :param tolerance: Maximum difference between coordinates to be considered equal.
+    :param cell_size: Size of each grid cell.
+    :returns: A list of keys.
+    """
+    return [(len(poly),) + cell for cell in cell_keys(poly.centroid, tolerance, cell_size)]
+
+
+def boxes_overlap(box1, box2, tolerance=0.0):
+    # type: (Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray], float) -> bool
+    """Check if two axis-aligned bounding boxes overlap.
+
+    :param box1: The minimum and maximum corners of the first box.
+    :param box2: The minimum and maximum corners of the second box.
+    :param tolerance: Padding to add on each side of the boxes.
+    :returns: True if the boxes overlap or touch.
+    """
+    return bool(np.all(box1[0] <= box2[1] + tolerance) and np.all(box2[0] <= box1[1] + tolerance))
+
+
+def box_contains(outer, inner, tolerance=PLANE_TOLERANCE):
+    # type: (Polygon3D, Polygon3D, float) -> bool
+    """Check if the bounding box of one polygon contains the bounding box of another.
+
+    :param outer: The polygon which may contain the other.
+    :param inner: The polygon which may be contained.
+    :param tolerance: Padding to add on each side of the outer box.
+    :returns: True if the inner box is inside the padded outer box.
+    """
+    outer_points, inner_points = outer.points_matrix, inner.points_matrix
+    return bool(
+        np.all(inner_points.min(axis=0) >= outer_points.min(axis=0) - tolerance) and
+        np.all(inner_points.max(axis=0) <= outer_points.max(axis=0) + tolerance))
+
+
+def plane_buckets(polys, tolerance=PLANE_TOLERANCE):
+    # type: (List[Polygon3D], float) -> Dict[Tuple[int, ...], List[int]]
+    """Group polygons which may be coplanar.
+
+    A polygon may appear in more than one bucket if it is close to the edge of a cell.
+
+    :param polys: A list of polygons.
+    :param tolerance: Maximum difference in distance and normal vector components to be considered coplanar.
+    :returns: Mapping of cell keys to lists of indices into polys.
+    """
+    buckets = defaultdict(list)  # type: Dict[Tuple[int, ...], List[int]]
+    for i, poly in enumerate(polys):
+        for key in cell_keys(plane_key_values(poly), tolerance):
+            buckets[key].append(i)
+    return buckets
+
+
+def bounding_boxes(polys, tolerance=PLANE_TOLERANCE):
+    # type: (List[Polygon3D], float) -> Tuple[np.ndarray, np.ndarray]
+    """Axis-aligned bounding boxes of a list of polygons, padded by a tolerance.
+
+    :param polys: A list of polygons.
+    :param tolerance: Padding to add on each side of the box.
+    :returns: Arrays of the minimum and maximum corners of each box.
+    """
+    offsets = np.cumsum([0] + [len(poly) for poly in polys])
+    vertices = np.concatenate([poly.points_matrix for poly in polys]) if polys else np.zeros((0, 3))
+    mins, maxs = kernels.bounding_boxes(pad_polygons(vertices, offsets)[0])
+    return mins - tolerance, maxs + tolerance
+
+
+def sweep_and_prune(indices, mins, maxs):
+    # type: (List[int], np.ndarray, np.ndarray) -> Set[Tuple[int, int]]
+    """Find the pairs of boxes which overlap.
+
+    Boxes are sorted along the x-axis, and each is only checked against the boxes whose x-extent it overlaps.
+
+    :param indices: Indices of the boxes to check.
+    :param mins: Minimum corners of all the boxes.
+    :param maxs: Maximum corners of all the boxes.
+    :returns: Set of (i, j) pairs where i < j.
+    """
+    pairs = set()  # type: Set[Tuple[int, int]]
+    ordered = sorted(indices, key=lambda i: mins[i, 0])
+    active = []  # type: List[int]
+    for i in ordered:
+        active = [j for j in active if maxs[j, 0] >= mins[i, 0]]
+        for j in active:
+            if np.all(mins[i, 1:] <= maxs[j, 1:]) and np.all(mins[j, 1:] <= maxs[i, 1:]):
+                pairs.add((min(i, j), max(i, j)))
+        active.append(i)
+    return pairs
+
+
+def candidate_pairs(polys, tolerance=PLANE_TOLERANCE):
+    # type: (List[Polygon3D], float) -> List[Tuple[int, int]]
+    """Find the pairs of polygons which may be coplanar and overlapping.
+
+    This is a superset of the pairs which intersect, in the same order as `itertools.combinations`.
+
+    :param polys: A list of polygons.
+    :param tolerance: Tolerance used when bucketing planes and padding bounding boxes.
+    :returns: A sorted list of (i, j) pairs of indices into polys where i < j.
+    """
+    mins, maxs = bounding_boxes(polys, tolerance)
+    pairs = set()  # type: Set[Tuple[int, int]]
+    for indices in plane_buckets(polys, tolerance).values():
+        if len(indices) > 1:
+            pairs.update(sweep_and_prune(indices, mins, maxs))
+    return sorted(pairs)
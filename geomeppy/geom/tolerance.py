@@ -0,0 +1,75 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""
+Comparison of numbers, vectors and arrays to within a number of decimal places.
+
+Two values are equal if their difference rounds to zero at the given number of decimal places, as in
+`geomeppy.utilities.almostequal`. That function accepts anything and works out what it has been given by trying to
+convert it to a float. The functions here each handle one kind of input directly.
+
+"""
+from typing import Sequence  # noqa
+
+import numpy as np
+
+PLACES = 7
+
+
+def tolerance(places=PLACES):
+    # type: (int) -> float
+    """The largest difference between two values which still rounds to zero.
+
+    :param places: Number of decimal places.
+    :returns: The tolerance.
+    """
+    return 0.5 * 10 ** -places
+
+
+def isclose(first, second, places=PLACES):
+    # type: (float, float, int) -> bool
+    """Test two numbers for near equality.
+
+    :param first: A number.
+    :param second: Another number.
+    :param places: Number of decimal places to compare to. Default is 7.
+    :returns: True if the difference rounds to zero.
+    """
+    return round(abs(first - second), places) == 0
+
+
+def vectors_isclose(first, second, places=PLACES):
+    # type: (Sequence[float], Sequence[float], int) -> bool
+    """Test two short sequences of numbers, such as vectors, for near equality.
+
+    As with `almostequal`, only the items up to the length of the shorter sequence are compared.
+
+    :param first: A sequence of numbers.
+    :param second: Another sequence of numbers.
+    :param places: Number of decimal places to compare to. Default is 7.
+    :returns: True if the difference between each pair of items rounds to zero.
+    """
+    for a, b in zip(first, second):
+        if round(abs(a - b), places) != 0:
+            return False
+    return True
+
+
+def arrays_isclose(first, second, places=PLACES):
+    # type: (np.ndarray, np.ndarray, int) -> bool
+    """Test two arrays, such as the vertices of polygons, for near equality.
+
+    :param first: An array.
+    :param second: Another array.
+    :param places: Number of decimal places to compare to. Default is 7.
+    :returns: True if the arrays are the same shape and the difference between each pair of items is within the
+        tolerance.
+    """
+    first = np.asarray(first, dtype=float)
+    second = np.asarray(second, dtype=float)
+    if first.shape != second.shape:
+        return False
+    return bool(np.isclose(first, second, rtol=0, atol=tolerance(places)).all())
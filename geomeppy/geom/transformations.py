@@ -11,7 +11,8 @@ OpenStudio for the sake of consistency between tools based on EnergyPlus.
 
 """
 
-from typing import Optional, Union  # noqa
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Union  # noqa
 
 import numpy as np
 from transforms3d._gohlketransforms import (
@@ -50,14 +51,23 @@ class Transformation(object):
             return Transformation(mat)
         elif hasattr(other, 'x'):
             # matrix by a vector
-            vector = other
-            temp = [vector.x, vector.y, vector.z, 1]  # type: ignore
+            temp = other.args + (1.0,)  # type: ignore
             result = np.dot(self.matrix, temp)[:3]
             return Vector3D(*result)
         else:
-            # matrix by each point in a polygon
-            result = [self * point for point in other]
-            return other.__class__(result)
+            # matrix by all the points in a polygon at once
+            return other.__class__(self.apply(other))
+
+    def apply(self, points):
+        # type: (Any) -> np.ndarray
+        """Apply the transformation to a set of points in a single array operation.
+
+        :param points: A polygon, an (n, 3) array or a sequence of 3D points.
+        :returns: An (n, 3) array of the transformed points.
+        """
+        points = np.asarray(getattr(points, 'points_matrix', points), dtype=float).reshape(-1, 3)
+        homogeneous = np.hstack([points, np.ones((len(points), 1))])
+        return np.dot(homogeneous, self.matrix.T)[:, :3]
 
     def _align_z_prime(self, zp):
         # type: (Vector3D) -> Transformation
@@ -65,23 +75,7 @@ class Transformation(object):
         with z, but if that fails will align y' with y
 
         """
-        zp = zp.normalize()
-
-        z_axis = Vector3D(0, 0, 1)
-        neg_x_axis = Vector3D(-1, 0, 0)
-
-        # check if face normal is up or down
-        if abs(zp.dot(z_axis)) < 0.99:
-            # not facing up or down, set yPrime along z_axis
-            yp = z_axis - zp.dot(z_axis) * zp
-            yp = yp.normalize()
-            xp = yp.cross(zp)
-        else:
-            # facing up or down, set xPrime along -x_axis
-            xp = neg_x_axis - zp.dot(neg_x_axis) * zp
-            xp = xp.normalize()
-            yp = zp.cross(xp)
-
+        xp, yp, zp = plane_axes(zp)
         self.matrix[:3, 0] = xp
         self.matrix[:3, 1] = yp
         self.matrix[:3, 2] = zp
@@ -101,16 +95,11 @@ class Transformation(object):
         Transformation
 
         """
-        zp = polygon.normal_vector
-        align = self._align_z_prime(zp)
-
-        aligned_vertices = align._inverse() * polygon
-        min_x = min(aligned_vertices.xs)
-        min_y = min(aligned_vertices.ys)
-        min_z = min(aligned_vertices.zs)
-        assert aligned_vertices.is_horizontal
+        axes = alignment_axes(polygon._normal_vector())
+        align = Transformation()
+        align.matrix[:3, :3] = axes.T
 
-        direction = Vector3D(min_x, min_y, min_z)
+        direction = np.dot(polygon.points_matrix, axes.T).min(axis=0)
         translate = self._translation(direction)
 
         self.matrix = concatenate_matrices(align.matrix, translate.matrix)
@@ -136,6 +125,78 @@ class Transformation(object):
         # type: (Vector3D, Union[int, np.float]) -> Transformation
         return Transformation(rotation_matrix(angle, direction))
 
+    def _scaling(self, factors):
+        # type: (Vector3D) -> Transformation
+        return Transformation(np.diag([factors[0], factors[1], factors[2], 1.0]))
+
+
+ALIGNMENT_CACHE_SIZE = 256
+ALIGNMENT_PLACES = 14
+_alignment_cache = OrderedDict()  # type: OrderedDict
+
+
+def alignment_axes(normal):
+    # type: (Union[Vector3D, Sequence[float]]) -> np.ndarray
+    """The axes of the plane of a normal vector, as returned by `plane_axes`.
+
+    A building usually has only a few distinct surface orientations, so the axes are kept in a least recently used
+    cache keyed by the normal vector rounded to `ALIGNMENT_PLACES`. The axes are orthonormal, so the same array both
+    aligns points with the plane (points . axes.T) and returns them to their original orientation (points . axes).
+
+    :param normal: The normal vector.
+    :returns: A read-only (3, 3) array with rows x', y' and z'.
+    """
+    key = tuple(round(float(i), ALIGNMENT_PLACES) for i in normal)
+    try:
+        axes = _alignment_cache.pop(key)
+    except KeyError:
+        axes = plane_axes(key)
+        axes.flags.writeable = False
+        if len(_alignment_cache) >= ALIGNMENT_CACHE_SIZE:
+            _alignment_cache.popitem(last=False)
+    _alignment_cache[key] = axes
+    return axes
+
+
+def plane_axes(zp):
+    # type: (Union[Vector3D, np.ndarray]) -> np.ndarray
+    """The axes of a coordinate system with z' along a normal vector.
+
+    This will try to align y' with z, but if that fails will align x' with -x, as in OpenStudio.
+
+    :param zp: The normal vector. This does not need to be of unit length.
+    :returns: A (3, 3) array with rows x', y' and z'.
+    """
+    zp = np.asarray(zp, dtype=float)
+    zp = zp / np.sqrt((zp ** 2).sum())
+    # check if face normal is up or down
+    if abs(zp[2]) < 0.99:
+        # not facing up or down, set y' along the z-axis
+        yp = np.array([0.0, 0.0, 1.0]) - zp[2] * zp
+        yp = yp / np.sqrt((yp ** 2).sum())
+        xp = np.cross(yp, zp)
+    else:
+        # facing up or down, set x' along the negative x-axis
+        xp = np.array([-1.0, 0.0, 0.0]) + zp[0] * zp
+        xp = xp / np.sqrt((xp ** 2).sum())
+        yp = np.cross(zp, xp)
+    return np.array([xp, yp, zp])
+
+
+def transform_polygons(transformation, polygons):
+    # type: (Transformation, List[Polygon3D]) -> List[Polygon3D]
+    """Apply a transformation to a batch of polygons in a single array operation.
+
+    :param transformation: The transformation to apply.
+    :param polygons: A list of polygons.
+    :returns: A list of the transformed polygons, in the same order.
+    """
+    if not polygons:
+        return []
+    points = transformation.apply(np.vstack([poly.points_matrix for poly in polygons]))
+    splits = np.cumsum([len(poly) for poly in polygons])[:-1]
+    return [poly.__class__(chunk) for poly, chunk in zip(polygons, np.split(points, splits))]
+
 
 def align_face(polygon):
     # type: (Polygon3D) -> Polygon3D
@@ -144,10 +205,10 @@ def align_face(polygon):
     :param polygon: Polygon to be aligned.
     :returns: Polygon3D aligned with the z-axis.
     """
-    t = Transformation()
-    t._align_face(polygon)
+    axes = alignment_axes(polygon._normal_vector())
+    aligned = np.dot(polygon.points_matrix, axes.T)
 
-    return t._inverse() * polygon
+    return polygon.__class__(aligned - aligned.min(axis=0))
 
 
 def invert_align_face(original, poly2):
@@ -158,7 +219,7 @@ def invert_align_face(original, poly2):
     :param poly2: Polygon previously aligned with `align_face`.
     :returns: Polygon returned to the original orientation.
     """
-    t = Transformation()
-    t._align_face(original)
+    axes = alignment_axes(original._normal_vector())
+    offset = np.dot(original.points_matrix, axes.T).min(axis=0)
 
-    return t * poly2
+    return poly2.__class__(np.dot(poly2.points_matrix + offset, axes))
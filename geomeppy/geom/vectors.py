@@ -7,6 +7,7 @@
 """Utilities for IDF vectors.
 """
 
+import operator
 from typing import Any, Iterator, List, Sized, Tuple, Union  # noqa
 
 import numpy as np
@@ -17,22 +18,37 @@ if MYPY:
 
 
 class Vector2D(Sized):
-    """Two dimensional point."""
+    """Two dimensional point.
+
+    The coordinates are held as a single tuple of floats in `args`, and the instances have no `__dict__`. Vectors are
+    immutable, since they are hashed and used as keys, so methods such as `set_length` return a new vector.
+
+    """
+
+    __slots__ = ('args',)
 
     def __init__(self, *args):
         # type: (*Any) -> None
-        self.args = list(args)
-        self.x = float(args[0])
-        self.y = float(args[1])
+        self.args = tuple(float(i) for i in args)  # type: Tuple[float, ...]
+
+    @property
+    def x(self):
+        # type: () -> float
+        return self.args[0]
+
+    @property
+    def y(self):
+        # type: () -> float
+        return self.args[1]
 
     def __iter__(self):
         # type: () -> Iterator
-        return (i for i in self.args)
+        return iter(self.args)
 
     def __repr__(self):
         # type: () -> str
         class_name = type(self).__name__
-        return '{}({!r}, {!r})'.format(class_name, *self.args)
+        return '{}({})'.format(class_name, ', '.join(repr(i) for i in self.args))
 
     def __eq__(self, other):
         # type: (Union[List[float], Vector2D, Vector3D]) -> bool
@@ -43,15 +59,15 @@ class Vector2D(Sized):
 
     def __sub__(self, other):
         # type: (Union[Vector2D, Vector3D, np.ndarray]) -> Union[Vector2D, Vector3D]
-        return self.__class__(*[self[i] - other[i] for i in range(len(self))])
+        return self.__class__(*map(operator.sub, self.args, other))
 
     def __add__(self, other):
         # type: (Any) -> Union[Vector2D, Vector3D]
-        return self.__class__(*[self[i] + other[i] for i in range(len(self))])
+        return self.__class__(*map(operator.add, self.args, other))
 
     def __neg__(self):
         # type: () -> Union[Vector2D, Vector3D]
-        return self.__class__(*inverse_vector(self))
+        return self.__class__(*map(operator.neg, self.args))
 
     def __len__(self):
         # type: () -> int
@@ -61,19 +77,24 @@ class Vector2D(Sized):
         # type: (Union[int, slice]) -> Union[Tuple[float, float, float], float]
         return self.args[key]
 
-    def __setitem__(self, key, value):
-        self.args[key] = value
-
     def __hash__(self):
         return hash(self.x) ^ hash(self.y)
 
+    def __getstate__(self):
+        # type: () -> Tuple[float, ...]
+        return self.args
+
+    def __setstate__(self, state):
+        # type: (Tuple[float, ...]) -> None
+        self.args = state
+
     def dot(self, other):
         # type: (Vector3D) -> np.float64
-        return np.dot(self, other)
+        return np.dot(self.args, other)
 
     def cross(self, other):
         # type: (Vector3D) -> np.ndarray
-        return np.cross(self, other)
+        return np.cross(self.args, other)
 
     @property
     def length(self):
@@ -110,8 +131,7 @@ class Vector2D(Sized):
         # type: (float) -> Union[Vector2D, Vector3D]
         current_length = self.length
         multiplier = new_length / current_length
-        self.args = [i * multiplier for i in self.args]
-        return self
+        return self.__class__(*(i * multiplier for i in self.args))
 
     def invert(self):
         # type: () -> Union[Vector2D, Vector3D]
@@ -121,24 +141,40 @@ class Vector2D(Sized):
 class Vector3D(Vector2D):
     """Three dimensional point."""
 
+    __slots__ = ()
+
     def __init__(self,
                  x,  # type: Union[float, np.float64]
                  y,  # type: Union[float, np.float64]
                  z=0  # type: Union[float, np.float64]
                  ):
         # type: (...) -> None
-        super(Vector3D, self).__init__(x, y)
-        self.z = float(z)
-        self.args = (self.x, self.y, self.z)
+        self.args = (float(x), float(y), float(z))
 
-    def __repr__(self):
-        # type: () -> str
-        class_name = type(self).__name__
-        return '{}({!r}, {!r}, {!r})'.format(class_name, *self.args)
+    @property
+    def z(self):
+        # type: () -> float
+        return self.args[2]
+
+    def __sub__(self, other):
+        # type: (Union[Vector2D, Vector3D, np.ndarray]) -> Vector3D
+        x, y, z = self.args
+        return Vector3D(x - other[0], y - other[1], z - other[2])
+
+    def __add__(self, other):
+        # type: (Any) -> Vector3D
+        x, y, z = self.args
+        return Vector3D(x + other[0], y + other[1], z + other[2])
+
+    def __neg__(self):
+        # type: () -> Vector3D
+        x, y, z = self.args
+        return Vector3D(-x, -y, -z)
 
     def __hash__(self):
         # type: () -> int
-        return hash(self.x) ^ hash(self.y) ^ hash(self.z)
+        x, y, z = self.args
+        return hash(x) ^ hash(y) ^ hash(z)
 
 
 def normalise_vector(v):
@@ -0,0 +1,133 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""
+An on-disk cache of the parsed IDD.
+
+Parsing the full Energy+.idd takes seconds, and is repeated by every new process which reads an IDF. When a cache
+directory is set, either through `IDF.setiddname(iddname, cache_dir=...)` or the GEOMEPPY_IDD_CACHE environment
+variable, the parsed IDD is pickled to that directory, keyed by a hash of the IDD contents, and later processes load it
+from there instead of parsing it again.
+
+The cache files are loaded with pickle, so the cache directory should only be writable by trusted users.
+
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple, Union  # noqa
+
+import eppy
+from eppy.EPlusInterfaceFunctions import parse_idd
+from six import StringIO  # noqa
+
+IDD_CACHE_VERSION = 1
+IDD_CACHE_ENV = 'GEOMEPPY_IDD_CACHE'
+
+
+def get_cache_dir(cache_dir=None):
+    # type: (Optional[str]) -> Optional[str]
+    """The directory to cache the parsed IDD in.
+
+    :param cache_dir: A directory. Defaults to the GEOMEPPY_IDD_CACHE environment variable.
+    :returns: The directory, or None if the cache is not in use.
+    """
+    return cache_dir or os.environ.get(IDD_CACHE_ENV) or None
+
+
+def extractidddata(iddfile, cache_dir=None):
+    # type: (Union[str, StringIO], Optional[str]) -> Tuple[List, List, Dict]
+    """Parse an IDD, loading the result from the cache if it is there.
+
+    :param iddfile: Name of the IDD file, or an open file handle.
+    :param cache_dir: Directory for the cache. Defaults to the GEOMEPPY_IDD_CACHE environment variable. If neither is
+        set the IDD is parsed without using the cache.
+    :returns: block EnergyPlus field ID names of the IDF from the IDD.
+    :returns: commdct Descriptions of IDF fields from the IDD.
+    :returns: idd_index A pair of dicts used for fast lookups of names of groups of objects.
+    """
+    cache_dir = get_cache_dir(cache_dir)
+    if not cache_dir:
+        block, _commlst, commdct, idd_index = parse_idd.extractidddata(iddfile)
+        return block, commdct, idd_index
+    if hasattr(iddfile, 'read'):
+        contents = iddfile.read()
+        iddfile = StringIO(contents)
+        if not isinstance(contents, bytes):
+            contents = contents.encode('utf-8')
+    else:
+        with open(iddfile, 'rb') as f:
+            contents = f.read()
+    path = cache_path(cache_dir, hashlib.sha1(contents).hexdigest())
+    cached = load_cache(path)
+    if cached is not None:
+        return cached
+    block, _commlst, commdct, idd_index = parse_idd.extractidddata(iddfile)
+    save_cache(path, (block, commdct, idd_index))
+    return block, commdct, idd_index
+
+
+def cache_path(cache_dir, digest):
+    # type: (str, str) -> str
+    """The path of the cache file for an IDD.
+
+    The name includes the cache format version and the Python major version, since pickles written by Python 3 may not
+    be readable by Python 2. It also includes the eppy version, since the parsed IDD comes from eppy's parser and its
+    structure may change between versions.
+
+    :param cache_dir: Directory for the cache.
+    :param digest: Hash of the IDD contents.
+    :returns: Path to the cache file.
+    """
+    eppy_version = getattr(eppy, '__version__', 'unknown')
+    name = 'idd-{}-v{}-py{}-eppy{}.pickle'.format(digest, IDD_CACHE_VERSION, sys.version_info[0], eppy_version)
+    return os.path.join(cache_dir, name)
+
+
+def load_cache(path):
+    # type: (str) -> Optional[Tuple[List, List, Dict]]
+    """Load a parsed IDD from the cache.
+
+    :param path: Path to the cache file.
+    :returns: The block, commdct and idd_index, or None if the file is missing, unreadable or from another version.
+    """
+    try:
+        with open(path, 'rb') as f:
+            version, data = pickle.load(f)
+    except Exception:
+        return None
+    if version != IDD_CACHE_VERSION:
+        return None
+    return data
+
+
+def save_cache(path, data):
+    # type: (str, Tuple[List, List, Dict]) -> None
+    """Save a parsed IDD to the cache.
+
+    The file is written under a temporary name and then renamed, so other processes never see a partly written file.
+    Failing to write the cache is not an error, and any partly written temporary file is removed.
+
+    :param path: Path to the cache file.
+    :param data: The block, commdct and idd_index.
+    """
+    directory = os.path.dirname(path)
+    temp_path = None
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as f:
+            pickle.dump((IDD_CACHE_VERSION, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(temp_path, path)
+    except (IOError, OSError, pickle.PicklingError, TypeError):
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
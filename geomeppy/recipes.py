@@ -5,14 +5,14 @@
 #  http://opensource.org/licenses/MIT)
 # =======================================================================
 """Recipes for making changes to EnergyPlus IDF files."""
-import itertools
-from typing import List, Tuple, Union  # noqa
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union  # noqa
 
 from eppy.idf_msequence import Idf_MSequence  # noqa
 import numpy as np
 
+from .geom.geometry_table import GeometryTable
 from .geom.intersect_match import getidfsurfaces
-from .geom.polygons import Polygon3D
+from .geom.polygons import Polygon, Polygon3D
 from .geom.transformations import Transformation
 from .geom.vectors import Vector2D, Vector3D  # noqa
 
@@ -20,6 +20,12 @@ MYPY = False
 if MYPY:
     from .eppy_patches import EpBunch, IDF  # noqa
 
+TRANSFORM_KEYS = (
+    'BUILDINGSURFACE:DETAILED',
+    'FENESTRATIONSURFACE:DETAILED',
+    'SHADING:ZONE:DETAILED',
+)
+
 
 def set_default_constructions(idf):
     # type: (IDF) -> None
@@ -77,16 +83,38 @@ def set_default_construction(surface):
         surface.Construction_Name = 'Project Door'
 
 
-def set_wwr(idf, wwr=0.2, construction=None, force=False):
-    # type: (IDF, Optional[float], Optional[str], Optional[bool]) -> None
+def set_wwr(idf,  # type: IDF
+            wwr=0.2,  # type: Optional[float]
+            construction=None,  # type: Optional[str]
+            force=False,  # type: Optional[bool]
+            wwr_map=None,  # type: Optional[Dict[Union[int, str], float]]
+            sill_height=None,  # type: Optional[float]
+            n_windows=1  # type: int
+            ):
+    # type: (...) -> None
     """Set the window to wall ratio on all external walls.
 
+    By default each wall gets a single strip window, centred on the wall. If a sill height or more than one window per
+    wall is given, each wall instead gets `n_windows` rectangular windows spaced evenly along it. Walls with a window to
+    wall ratio of zero are left without windows.
+
+    All the walls are checked before any subsurfaces are removed, so if a ValueError is raised the IDF is unchanged.
+
     :param idf: The IDF to edit.
     :param wwr: The window to wall ratio.
     :param construction: Name of a window construction.
     :param force: True to remove all subsurfaces before setting the WWR.
+    :param wwr_map: Window to wall ratios for particular walls, keyed by either the wall name or the wall azimuth in
+        whole degrees clockwise from north, e.g. {0: 0.1, 180: 0.4}. Walls not in the map use `wwr`.
+    :param sill_height: Height of the bottom of the windows above the bottom of the wall.
+    :param n_windows: Number of windows on each wall.
+    :raises ValueError: If `n_windows` is less than 1, `sill_height` is negative, or the windows do not fit on a wall.
 
     """
+    if n_windows < 1:
+        raise ValueError('n_windows must be at least 1, got {}'.format(n_windows))
+    if sill_height is not None and sill_height < 0:
+        raise ValueError('sill_height must not be negative, got {}'.format(sill_height))
     try:
         ggr = idf.idfobjects['GLOBALGEOMETRYRULES'][0]
     except IndexError:
@@ -95,37 +123,106 @@ def set_wwr(idf, wwr=0.2, construction=None, force=False):
         s for s in idf.idfobjects['BUILDINGSURFACE:DETAILED']
         if s.Surface_Type.lower() == 'wall' and s.Outside_Boundary_Condition.lower() == 'outdoors'
     ]
-    subsurfaces = [idf.idfobjects[key.upper()] for key in idf.idd_index['ref2names']['SubSurfNames']]
+    constructions, old_subsurfaces = _check_subsurfaces(idf, external_walls, construction, force)
+    walls = GeometryTable(external_walls)
+    ratios = wall_wwrs(walls, wwr, wwr_map)
+    if sill_height is None and n_windows == 1:
+        vertices = window_vertices_given_walls(walls.vertices, walls.offsets, ratios)
+        windows = [[vertices[walls.offsets[i]:walls.offsets[i + 1]]] for i in range(len(walls))]
+    else:
+        windows = window_rectangles_given_walls(
+            walls.vertices, walls.offsets, walls.normals, walls.areas * ratios, sill_height, n_windows)
+        outside = [walls.names[i] for i in np.nonzero(np.isnan(windows[:, 0, 0, 2]) & (ratios > 0))[0]]
+        if outside:
+            raise ValueError('The windows would extend above the top or below the bottom of walls {}'.format(outside))
+    # remove all subsurfaces
+    idf.removeidfobjects(old_subsurfaces)
+    new_windows = []
+    new_vertices = []
+    for i, name in enumerate(walls.names):
+        if not ratios[i]:
+            continue
+        for j, coords in enumerate(windows[i]):
+            new_windows.append(dict(
+                Name="%s window" % name if len(windows[i]) == 1 else "%s window %i" % (name, j + 1),
+                Surface_Type='Window',
+                Construction_Name=constructions[i],
+                Building_Surface_Name=name,
+                View_Factor_to_Ground='autocalculate',  # from the surface angle
+            ))
+            new_vertices.append(Polygon3D(coords).normalize_coords(ggr).points_matrix.ravel().tolist())
+    idf.newidfobjects('FENESTRATIONSURFACE:DETAILED', new_windows, new_vertices)
+
+
+def _check_subsurfaces(idf, external_walls, construction, force):
+    # type: (IDF, List[EpBunch], Optional[str], Optional[bool]) -> Tuple[List[Optional[str]], List[EpBunch]]
+    """Check the existing subsurfaces on the walls before replacing them with new windows.
+
+    :param idf: The IDF.
+    :param external_walls: The walls to check.
+    :param construction: Name of a window construction.
+    :param force: True to replace all subsurfaces, not only windows.
+    :returns: The window construction for each wall, and the subsurfaces to remove.
+    :raises ValueError: If a wall has subsurfaces which are not windows and `force` is False, or if it has windows with
+        different constructions and no construction is given.
+    """
+    subsurfaces = subsurface_index(idf)
+    constructions = []
+    old_subsurfaces = []
     for wall in external_walls:
         # get any subsurfaces on the wall
-        wall_subsurfaces = [
-            ss for ss in itertools.chain(*subsurfaces)
-            if ss.Building_Surface_Name == wall.Name
-        ]
+        wall_subsurfaces = subsurfaces.get(wall.Name, [])
         if not all(_is_window(wss) for wss in wall_subsurfaces) and not force:
             raise ValueError(
                 'Not all subsurfaces on wall "{name}" are windows. '
                 'Use `force=True` to replace all subsurfaces.'.format(name=wall.Name))
 
         if wall_subsurfaces and not construction:
-            constructions = list({wss.Construction_Name for wss in wall_subsurfaces if _is_window(wss)})
-            if len(constructions) > 1:
+            wall_constructions = list({wss.Construction_Name for wss in wall_subsurfaces if _is_window(wss)})
+            if len(wall_constructions) > 1:
                 raise ValueError(
                     'Not all subsurfaces on wall "{name}" have the same construction'.format(name=wall.Name))
-            construction = constructions[0]
-        # remove all subsurfaces
-        for ss in wall_subsurfaces:
-            idf.removeidfobject(ss)
-        coords = window_vertices_given_wall(wall, wwr)
-        window = idf.newidfobject(
-            'FENESTRATIONSURFACE:DETAILED',
-            Name="%s window" % wall.Name,
-            Surface_Type='Window',
-            Construction_Name=construction,
-            Building_Surface_Name=wall.Name,
-            View_Factor_to_Ground='autocalculate',  # from the surface angle
-        )
-        window.setcoords(coords, ggr)
+            construction = wall_constructions[0]
+        constructions.append(construction)
+        old_subsurfaces.extend(wall_subsurfaces)
+    return constructions, old_subsurfaces
+
+
+def wall_wwrs(walls, wwr, wwr_map=None):
+    # type: (GeometryTable, float, Optional[Dict[Union[int, str], float]]) -> np.ndarray
+    """Find the window to wall ratio for each wall.
+
+    :param walls: A GeometryTable of the walls.
+    :param wwr: The window to wall ratio for walls not in `wwr_map`.
+    :param wwr_map: Window to wall ratios keyed by either the wall name or the wall azimuth in whole degrees clockwise
+        from north. Names take precedence over azimuths.
+    :returns: An (m,) array of ratios.
+    """
+    ratios = np.full(len(walls), wwr, dtype=float)
+    if not wwr_map:
+        return ratios
+    azimuths = np.round(np.degrees(np.arctan2(walls.normals[:, 0], walls.normals[:, 1]))).astype(int) % 360
+    for i, (name, azimuth) in enumerate(zip(walls.names, azimuths)):
+        if name in wwr_map:
+            ratios[i] = wwr_map[name]
+        elif azimuth in wwr_map:
+            ratios[i] = wwr_map[azimuth]
+    return ratios
+
+
+def subsurface_index(idf):
+    # type: (IDF) -> Dict[str, List[EpBunch]]
+    """Find the subsurfaces on each surface in the IDF.
+
+    :param idf: The IDF.
+    :returns: A dict of the subsurfaces on each surface, keyed by the surface name.
+
+    """
+    index = {}  # type: Dict[str, List[EpBunch]]
+    for key in idf.idd_index['ref2names']['SubSurfNames']:
+        for subsurface in idf.idfobjects[key.upper()]:
+            index.setdefault(subsurface.Building_Surface_Name, []).append(subsurface)
+    return index
 
 
 def _is_window(subsurface):
@@ -149,19 +246,89 @@ def window_vertices_given_wall(wall, wwr):
     :returns: Window vertices bounding a vertical strip midway up the surface.
 
     """
-    vertices = wall.coords
-    average_x = sum([x for x, _y, _z in vertices]) / len(vertices)
-    average_y = sum([y for _x, y, _z in vertices]) / len(vertices)
-    average_z = sum([z for _x, _y, z in vertices]) / len(vertices)
-    # move windows in 0.5% from the edges so they can be drawn in SketchUp
-    window_points = [[
-        ((x - average_x) * 0.999) + average_x,
-        ((y - average_y) * 0.999) + average_y,
-        ((z - average_z) * wwr) + average_z
-    ]
-        for x, y, z in vertices]
+    vertices = np.array(wall.coords, dtype=float).reshape(-1, 3)
+    return Polygon3D(window_vertices_given_walls(vertices, [0, len(vertices)], wwr))
+
+
+def window_vertices_given_walls(vertices, offsets, wwr):
+    # type: (np.ndarray, Sequence[int], float) -> np.ndarray
+    """Calculate window vertices for many walls at once, as in `window_vertices_given_wall`.
+
+    :param vertices: An (N, 3) array of the vertices of all the walls.
+    :param offsets: An (m + 1,) array where wall i has the vertices from offsets[i] to offsets[i + 1], as in a
+        `GeometryTable`.
+    :param wwr: Window to wall ratio, either one for all walls or an (m,) array with one for each wall.
+    :returns: An (N, 3) array of the window vertices, with the same offsets as the walls.
 
-    return Polygon3D(window_points)
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    offsets = np.asarray(offsets)
+    if not len(vertices):
+        return vertices.copy()
+    counts = np.diff(offsets)
+    centres = np.add.reduceat(vertices, offsets[:-1], axis=0) / counts[:, np.newaxis]
+    centres = np.repeat(centres, counts, axis=0)
+    scales = np.ones((len(vertices), 3))
+    # move windows in 0.5% from the edges so they can be drawn in SketchUp
+    scales[:, :2] = 0.999
+    scales[:, 2] = np.repeat(np.broadcast_to(wwr, counts.shape), counts)
+    return ((vertices - centres) * scales) + centres
+
+
+def window_rectangles_given_walls(vertices,  # type: np.ndarray
+                                  offsets,  # type: Sequence[int]
+                                  normals,  # type: np.ndarray
+                                  window_areas,  # type: np.ndarray
+                                  sill_height=None,  # type: Optional[float]
+                                  n_windows=1  # type: int
+                                  ):
+    # type: (...) -> np.ndarray
+    """Calculate rectangular windows for many vertical walls at once.
+
+    Each wall is divided along its length into `n_windows` equal bays, and each bay has a window 99.9% of the bay width,
+    centred in the bay. The window height gives the required window area. The windows are centred vertically on the
+    wall unless a sill height is given.
+
+    :param vertices: An (N, 3) array of the vertices of all the walls.
+    :param offsets: An (m + 1,) array where wall i has the vertices from offsets[i] to offsets[i + 1].
+    :param normals: An (m, 3) array of the normal vectors of the walls.
+    :param window_areas: An (m,) array of the total window area on each wall.
+    :param sill_height: Height of the bottom of the windows above the bottom of the wall. Default is None.
+    :param n_windows: Number of windows on each wall. Default is 1.
+    :returns: An (m, n_windows, 4, 3) array of window vertices, ordered upper left, lower left, lower right, upper
+        right as seen from outside. The windows on a wall are NaN if they would extend above the top or below the
+        bottom of the wall.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    starts = np.asarray(offsets)[:-1]
+    counts = np.diff(offsets)
+    if not len(starts):
+        return np.zeros((0, n_windows, 4, 3))
+    centres = np.add.reduceat(vertices, starts, axis=0) / counts[:, np.newaxis]
+    # horizontal unit vector along each wall, to the right as seen from outside
+    along = np.stack([-normals[:, 1], normals[:, 0], np.zeros(len(normals))], axis=1)
+    along /= np.sqrt((along ** 2).sum(axis=1))[:, np.newaxis]
+    s = (vertices * np.repeat(along, counts, axis=0)).sum(axis=1) - np.repeat((centres * along).sum(axis=1), counts)
+    s_min, s_max = np.minimum.reduceat(s, starts), np.maximum.reduceat(s, starts)
+    z_min, z_max = np.minimum.reduceat(vertices[:, 2], starts), np.maximum.reduceat(vertices[:, 2], starts)
+    bay = (s_max - s_min) / n_windows
+    width = bay * 0.999
+    height = np.asarray(window_areas, dtype=float) / (n_windows * width)
+    if sill_height is None:
+        bottom = (z_min + z_max - height) / 2
+    else:
+        bottom = z_min + sill_height
+    top = bottom + height
+    outside = (top > z_max + 1e-9) | (bottom < z_min - 1e-9)
+    top[outside] = np.nan
+    bottom[outside] = np.nan
+    left = s_min[:, np.newaxis] + bay[:, np.newaxis] * (np.arange(n_windows) + 0.0005)  # (m, n)
+    right = left + width[:, np.newaxis]
+    s_corners = np.stack([left, left, right, right], axis=2)  # (m, n, 4)
+    z_corners = np.stack([top, bottom, bottom, top], axis=1)[:, np.newaxis, :]  # (m, 1, 4)
+    windows = centres[:, np.newaxis, np.newaxis, :] + s_corners[..., np.newaxis] * along[:, np.newaxis, np.newaxis, :]
+    windows[..., 2] = z_corners
+    return windows
 
 
 def translate_to_origin(idf):
@@ -267,3 +434,142 @@ def rotate_coords(coords, radians):
     rotation = Transformation()._rotation(Vector3D(0, 0, 1), radians)
     coords = rotation * coords
     return coords
+
+
+class TransformContext(object):
+    """Accumulate translations, rotations and scalings of an IDF and apply them in a single pass.
+
+    Each step is stored as a 4x4 matrix and the steps are fused into one matrix. On commit the vertices of all surfaces,
+    subsurfaces and shading surfaces are transformed in one array operation, and the vertices of each surface are
+    normalised only once. Used as a context manager, the transformations are committed at the end of the block::
+
+        with idf.transform() as t:
+            t.translate((10, 0))
+            t.rotate(90)
+
+    Translation does not change the order in which vertices should be entered, so if all the surfaces are already
+    normalised it is safe to pass `normalize=False` and skip normalising them after a pure translation.
+
+    """
+
+    def __init__(self, idf, keys=TRANSFORM_KEYS, normalize=True):
+        # type: (IDF, Sequence[str], Optional[bool]) -> None
+        self.idf = idf
+        self.keys = keys
+        self.normalize = normalize
+        self.transformation = Transformation()
+        self.n_steps = 0
+        self._table = None  # type: Optional[GeometryTable]
+
+    def __enter__(self):
+        # type: () -> TransformContext
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        if exc_type is None:
+            self.commit()
+
+    @property
+    def table(self):
+        # type: () -> GeometryTable
+        """The geometry of the surfaces to be transformed, read from the IDF when first needed."""
+        if self._table is None:
+            self._table = GeometryTable.from_idf(self.idf, self.keys)
+        return self._table
+
+    @property
+    def centroid(self):
+        # type: () -> Vector2D
+        """The centroid of the site bounding box, after the transformations added so far.
+
+        :returns: The centroid of the bounding box of all floors.
+
+        """
+        table = self.table
+        floors = [
+            table.coords(i) for i, s in enumerate(table.surfaces)
+            if table.keys[i] == 'BUILDINGSURFACE:DETAILED' and s.Surface_Type.lower() == 'floor'
+        ]
+        vertices = self.apply(np.concatenate(floors))
+        (min_x, min_y), (max_x, max_y) = vertices[:, :2].min(axis=0), vertices[:, :2].max(axis=0)
+        bbox = Polygon([Vector2D(min_x, max_y), Vector2D(min_x, min_y), Vector2D(max_x, min_y), Vector2D(max_x, max_y)])
+        return bbox.centroid
+
+    def apply(self, vertices):
+        # type: (np.ndarray) -> np.ndarray
+        """Apply the fused transformation to an array of vertices.
+
+        :param vertices: An (N, 3) array of vertices.
+        :returns: An (N, 3) array of transformed vertices.
+        """
+        return self.transformation.apply(vertices)
+
+    def add(self, transformation):
+        # type: (Transformation) -> TransformContext
+        """Add a transformation to be applied after those already added.
+
+        :param transformation: The transformation to add.
+        :returns: This context, so calls can be chained.
+        """
+        self.transformation = transformation * self.transformation
+        self.n_steps += 1
+        return self
+
+    def _about(self, transformation, anchor):
+        # type: (Transformation, Union[Vector2D, Vector3D]) -> TransformContext
+        """Add a transformation to be applied around an anchor point."""
+        anchor = Vector3D(*anchor)
+        t = Transformation()
+        return self.add(t._translation(anchor) * transformation * t._translation(-anchor))
+
+    def translate(self, vector):
+        # type: (Union[Tuple[float, float], Vector2D, Vector3D]) -> TransformContext
+        """Move the IDF in the direction given by a vector.
+
+        :param vector: A vector to translate by.
+        :returns: This context, so calls can be chained.
+        """
+        return self.add(Transformation()._translation(Vector3D(*vector)))
+
+    def rotate(self, angle, anchor=None):
+        # type: (Union[int, float], Optional[Union[Vector2D, Vector3D]]) -> TransformContext
+        """Rotate the IDF counterclockwise by the angle given.
+
+        :param angle: Angle (in degrees) to rotate by.
+        :param anchor: Point around which to rotate. Default is the centre of the IDF's bounding box.
+        :returns: This context, so calls can be chained.
+        """
+        anchor = anchor or self.centroid
+        rotation = Transformation()._rotation(Vector3D(0, 0, 1), np.deg2rad(angle))
+        return self._about(rotation, anchor)
+
+    def scale(self, factor, anchor=None, axes='xy'):
+        # type: (Union[int, float], Optional[Union[Vector2D, Vector3D]], Optional[str]) -> TransformContext
+        """Scale the IDF by a scaling factor.
+
+        :param factor: Factor to scale by.
+        :param anchor: Point to scale around. Default is the centre of the IDF's bounding box.
+        :param axes: Axes to scale on. Default 'xy'.
+        :returns: This context, so calls can be chained.
+        """
+        anchor = anchor or self.centroid
+        factors = Vector3D(*[factor if axis in axes else 1 for axis in 'xyz'])
+        return self._about(Transformation()._scaling(factors), anchor)
+
+    @property
+    def is_translation(self):
+        # type: () -> bool
+        """Whether the fused transformation is a pure translation."""
+        return np.array_equal(self.transformation.matrix[:3, :3], np.identity(3))
+
+    def commit(self):
+        # type: () -> None
+        """Apply the fused transformation to the IDF, then start again from the identity."""
+        if self.n_steps:
+            table = self.table
+            table.set_vertices(self.apply(table.vertices))
+            table.write_back(normalize=self.normalize or not self.is_translation)
+        self.transformation = Transformation()
+        self.n_steps = 0
+        self._table = None
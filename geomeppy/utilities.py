@@ -5,7 +5,8 @@
 #  http://opensource.org/licenses/MIT)
 # =======================================================================
 """Utilities for use in geomeppy."""
-from typing import Any  # noqa
+from functools import wraps
+from typing import Any, Callable  # noqa
 
 
 def almostequal(first, second, places=7):
@@ -26,3 +27,22 @@ def almostequal(first, second, places=7):
     except TypeError:
         # handle iterables
         return all([almostequal(a, b, places) for a, b in zip(first, second)])
+
+
+def memoized(func):
+    # type: (Callable) -> Callable
+    """Cache the result of a method which takes no arguments.
+
+    Results are stored in the `_cache` dict of the instance, so clearing that dict invalidates them.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self):
+        try:
+            return self._cache[name]
+        except KeyError:
+            result = self._cache[name] = func(self)
+            return result
+
+    return wrapper
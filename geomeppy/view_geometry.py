@@ -170,6 +170,11 @@ def _get_limits(idf=None, polygons=None):
         y = [pt[1] for color in polygons for p in polygons[color] for pt in p]
         z = [pt[2] for color in polygons for p in polygons[color] for pt in p]
 
+    elif idf and hasattr(idf, 'extent'):
+        # use the cached extent of a geomeppy IDF
+        mins, maxs = idf.extent(['BUILDINGSURFACE:DETAILED', 'FENESTRATIONSURFACE:DETAILED'])
+        x, y, z = zip(mins, maxs)
+
     elif idf:
         surfaces = _get_surfaces(idf)
 
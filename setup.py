@@ -56,6 +56,9 @@ setup(
         ':python_version>="3.4"': [
             'mypy==0.550',  # static type checking
         ],
+        'parallel:python_version<"3.2"': [
+            'futures',  # concurrent.futures backport for parallel intersection
+        ],
         'testing': [
             'codecov',
             'flake8',
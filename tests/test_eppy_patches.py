@@ -0,0 +1,207 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for eppy_patches.py"""
+from eppy.bunch_subclass import BadEPFieldError
+from eppy.iddcurrent import iddcurrent
+from eppy.modeleditor import IDDNotSetError
+import pytest
+from six import StringIO
+
+from geomeppy.eppy_patches import getfieldnames, IDF, iterrawobjects
+from geomeppy.geom.vectors import Vector2D
+from geomeppy.utilities import almostequal
+
+idf_txt = """
+Version, 8.5;
+Zone, z1 Thermal Zone, 0.0, 0.0, 0.0, 0.0, , 1, , , , , , Yes;
+Zone, z2 Thermal Zone, 0.0, 0.0, 0.0, 0.0, , 1, , , , , , Yes;
+BuildingSurface:Detailed, z1_FLOOR, Floor, , z1 Thermal Zone, ground, , NoSun, NoWind, , , 1.0, 2.1, 0.0, 2.0, 2.0, 0.0, 2.0, 1.0, 0.0, 1.0, 1.1, 0.0;
+"""
+
+
+@pytest.fixture()
+def base_idf():
+    # type: () -> IDF
+    iddfhandle = StringIO(iddcurrent.iddtxt)
+    if IDF.getiddname() == None:
+        IDF.setiddname(iddfhandle)
+    return IDF(StringIO(idf_txt))
+
+
+class TestMakeBunches():
+
+    def test_shared_field_names(self, base_idf):
+        # type: (IDF) -> None
+        z1, z2 = base_idf.idfobjects['ZONE']
+        assert z1.fieldnames is z2.fieldnames
+        assert z1.fieldnames[:2] == ['key', 'Name']
+        floor = base_idf.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        assert floor.Vertex_4_Zcoordinate == 0.0
+
+    def test_newidfobject(self, base_idf):
+        # type: (IDF) -> None
+        z3 = base_idf.newidfobject('ZONE', Name='z3 Thermal Zone')
+        assert z3.fieldnames is base_idf.idfobjects['ZONE'][0].fieldnames
+        assert z3.Name == 'z3 Thermal Zone'
+        with pytest.raises(ValueError):
+            base_idf.newidfobject('NOT_AN_OBJECT')
+
+    def test_newidfobjects(self, base_idf):
+        # type: (IDF) -> None
+        generation = base_idf.geometry_generation
+        windows = base_idf.newidfobjects(
+            'FENESTRATIONSURFACE:DETAILED',
+            [{'Name': 'w1', 'Surface_Type': 'Window'}, {'Name': 'w2'}],
+            [[0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1], [0, 0, 2, 0, 0, 1, 1, 0, 1]],
+        )
+        assert base_idf.idfobjects['FENESTRATIONSURFACE:DETAILED'].list1 == windows
+        assert base_idf.model.dt['FENESTRATIONSURFACE:DETAILED'] == [w.obj for w in windows]
+        assert all(w.theidf is base_idf for w in windows)
+        assert base_idf.geometry_generation > generation
+        w1, w2 = windows
+        assert (w1.Name, w1.Surface_Type) == ('w1', 'Window')
+        assert w1.obj[:-12] == base_idf.newidfobject(
+            'FENESTRATIONSURFACE:DETAILED', Name='w1', Surface_Type='Window').obj
+        assert w1.coords == [(0, 0, 1), (0, 0, 0), (1, 0, 0), (1, 0, 1)]
+        assert w2.coords == [(0, 0, 2), (0, 0, 1), (1, 0, 1)]
+        with pytest.raises(BadEPFieldError):
+            base_idf.newidfobjects('ZONE', [{'Not_A_Field': 1}])
+        with pytest.raises(ValueError):
+            base_idf.newidfobjects('NOT_AN_OBJECT', [{}])
+
+    def test_extended_fields(self, base_idf):
+        # type: (IDF) -> None
+        key_i = base_idf.model.dtls.index('BUILDINGSURFACE:DETAILED')
+        field_names = getfieldnames(base_idf.idd_info, key_i)
+        assert len(field_names) == len(base_idf.idd_info[key_i])
+        assert getfieldnames(base_idf.idd_info, key_i) is field_names
+
+
+class TestLazyBunches():
+
+    def test_lazy_read(self, base_idf):
+        # type: (IDF) -> None
+        lazy_idf = IDF(StringIO(idf_txt), lazy=True)
+        assert lazy_idf.idfobjects.materialized == []
+        assert list(lazy_idf.idfobjects) == list(base_idf.idfobjects)
+        assert 'ZONE' in lazy_idf.idfobjects
+        assert 'NOT_AN_OBJECT' not in lazy_idf.idfobjects
+        zones = lazy_idf.idfobjects['ZONE']
+        assert [z.Name for z in zones] == ['z1 Thermal Zone', 'z2 Thermal Zone']
+        assert lazy_idf.idfobjects.materialized == ['ZONE']
+        assert lazy_idf.idfobjects['ZONE'] is zones
+        lazy_idf.newidfobject('ZONE', Name='z3 Thermal Zone')
+        base_idf.newidfobject('ZONE', Name='z3 Thermal Zone')
+        assert lazy_idf.idfstr() == base_idf.idfstr()
+        with pytest.raises(KeyError):
+            lazy_idf.idfobjects['NOT_AN_OBJECT']
+
+    def test_delete_and_set_key(self):
+        # type: () -> None
+        lazy_idf = IDF(StringIO(idf_txt), lazy=True)
+        idfobjects = lazy_idf.idfobjects
+        n_keys = len(idfobjects)
+        zones = idfobjects['ZONE']
+        del idfobjects['ZONE']
+        assert 'ZONE' not in idfobjects
+        assert 'ZONE' not in list(idfobjects)
+        assert len(idfobjects) == n_keys - 1
+        with pytest.raises(KeyError):
+            idfobjects['ZONE']
+        idfobjects['ZONE'] = zones
+        assert 'ZONE' in idfobjects
+        assert list(idfobjects)[-1] == 'ZONE'
+        assert len(idfobjects) == n_keys
+        assert idfobjects['ZONE'] is zones
+
+
+class TestIterObjects():
+
+    def test_iterobjects(self, base_idf):
+        # type: (IDF) -> None
+        objs = list(IDF.iterobjects(StringIO(idf_txt)))
+        assert [obj.key for obj in objs] == ['Version', 'Zone', 'Zone', 'BuildingSurface:Detailed']
+        surfaces = list(IDF.iterobjects(StringIO(idf_txt), keys=['buildingsurface:detailed']))
+        assert len(surfaces) == 1
+        expected = base_idf.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        assert surfaces[0].obj == expected.obj
+        assert surfaces[0].coords == expected.coords
+
+    def test_iterobjects_without_idd(self, monkeypatch):
+        # type: (...) -> None
+        monkeypatch.setattr(IDF, 'iddname', None)
+        # the error is raised when iterobjects is called, not when the first object is read
+        with pytest.raises(IDDNotSetError):
+            IDF.iterobjects(StringIO(idf_txt))
+
+    def test_iterrawobjects(self):
+        # type: () -> None
+        lines = ['Zone, z1, ! a comment; with a semicolon\n', '  0.0;Zone,\n', 'z2;\n', '\n']
+        assert list(iterrawobjects(lines)) == [['Zone', 'z1', '0.0'], ['Zone', 'z2']]
+        assert list(iterrawobjects(lines, keys=['VERSION'])) == []
+
+
+class TestSelectiveConversion():
+
+    def test_conv_keys(self, base_idf):
+        # type: (IDF) -> None
+        idf = IDF(StringIO(idf_txt), conv_keys=['BuildingSurface:Detailed'])
+        zone = idf.idfobjects['ZONE'][0]
+        assert zone.X_Origin == '0.0'
+        floor = idf.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        assert floor.obj == base_idf.idfobjects['BUILDINGSURFACE:DETAILED'][0].obj
+
+    def test_lazy_conversion(self, base_idf):
+        # type: (IDF) -> None
+        idf = IDF(StringIO(idf_txt), lazy=True)
+        assert idf.model.dt['ZONE'][0][2] == '0.0'
+        zone = idf.idfobjects['ZONE'][0]
+        assert zone.obj == base_idf.idfobjects['ZONE'][0].obj
+        assert idf.model.dt['BUILDINGSURFACE:DETAILED'][0][11] == '1.0'
+
+
+class TestExtent():
+
+    def test_extent_cache(self, base_idf):
+        # type: (IDF) -> None
+        mins, maxs = base_idf.extent()
+        assert list(mins) == [1.0, 1.0, 0.0]
+        assert list(maxs) == [2.0, 2.1, 0.0]
+        assert almostequal(base_idf.centroid, Vector2D(1.5, 1.55))
+        generation = base_idf.geometry_generation
+        assert base_idf.extent()[0].tolist() == mins.tolist()
+        assert base_idf.geometry_generation == generation
+
+        floor = base_idf.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        floor.setcoords([(0, 0, 0), (4, 0, 0), (4, 4, 0), (0, 4, 0)])
+        assert base_idf.geometry_generation > generation
+        assert base_idf.centroid == Vector2D(2.0, 2.0)
+
+        wall = base_idf.newidfobject('BUILDINGSURFACE:DETAILED', Name='wall')
+        wall.setcoords([(0, 0, 3), (0, 0, 0), (0, -1, 0), (0, -1, 3)])
+        assert base_idf.extent()[1].tolist() == [4.0, 4.0, 3.0]
+        base_idf.removeidfobject(wall)
+        assert base_idf.extent()[1].tolist() == [4.0, 4.0, 0.0]
+
+    def test_extent_cache_direct_edits(self, base_idf):
+        # type: (IDF) -> None
+        assert almostequal(base_idf.centroid, Vector2D(1.5, 1.55))
+        floor = base_idf.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        floor.Vertex_2_Xcoordinate = 4.0
+        floor['Vertex_3_Xcoordinate'] = 4.0
+        assert base_idf.bounding_box().xs == [1.0, 1.0, 4.0, 4.0]
+        floor.Surface_Type = 'Roof'
+        with pytest.raises(ValueError):
+            base_idf.centroid  # there are no floors
+        floor.Surface_Type = 'Floor'
+        assert almostequal(base_idf.centroid, Vector2D(2.5, 1.55))
+        # surfaces appended to idfobjects directly
+        other = IDF(StringIO(idf_txt))
+        new_floor = other.idfobjects['BUILDINGSURFACE:DETAILED'][0]
+        new_floor.setcoords([(0, 0, 0), (0, -1, 0), (-1, -1, 0), (-1, 0, 0)])
+        base_idf.idfobjects['BUILDINGSURFACE:DETAILED'].append(new_floor)
+        assert base_idf.bounding_box().xs == [-1.0, -1.0, 4.0, 4.0]
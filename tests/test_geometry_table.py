@@ -0,0 +1,65 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for geometry_table.py"""
+from eppy.iddcurrent import iddcurrent
+import numpy as np
+import pytest
+from six import StringIO
+
+from geomeppy.eppy_patches import IDF
+from geomeppy.geom.polygons import Polygon3D
+from geomeppy.utilities import almostequal
+
+idf_txt = """
+Version, 8.5;
+Zone, z1 Thermal Zone, 0.0, 0.0, 0.0, 0.0, , 1, , , , , , Yes;
+BuildingSurface:Detailed, z1_FLOOR, Floor, , z1 Thermal Zone, ground, , NoSun, NoWind, , , 1.0, 2.1, 0.0, 2.0, 2.0, 0.0, 2.0, 1.0, 0.0, 1.0, 1.1, 0.0;
+BuildingSurface:Detailed, z1_WALL_0001, WALL, , z1 Thermal Zone, outdoors, , SunExposed, WindExposed, , , 1.0, 1.1, 0.5, 1.0, 1.1, 0.0, 1.0, 2.1, 0.0, 1.0, 2.1, 0.5;
+FenestrationSurface:Detailed, z1_WINDOW, Window, , z1_WALL_0001, , autocalculate, , , 1, 3, 1.0, 1.2, 0.4, 1.0, 1.2, 0.1, 1.0, 2.0, 0.1;
+Shading:Zone:Detailed, z1_SHADE, z1_WALL_0001, , 4, 1.0, 1.1, 0.5, 0.9, 1.1, 0.5, 0.9, 2.1, 0.5, 1.0, 2.1, 0.5;
+"""
+
+
+@pytest.fixture()
+def base_idf():
+    # type: () -> IDF
+    iddfhandle = StringIO(iddcurrent.iddtxt)
+    if IDF.getiddname() == None:
+        IDF.setiddname(iddfhandle)
+    return IDF(StringIO(idf_txt))
+
+
+class TestGeometryTable():
+
+    def test_geometry_table(self, base_idf):
+        # type: (IDF) -> None
+        table = base_idf.geometry_table()
+        assert len(table) == 4
+        assert table.names == ['z1_FLOOR', 'z1_WALL_0001', 'z1_WINDOW', 'z1_SHADE']
+        assert list(table.offsets) == [0, 4, 8, 11, 15]
+        assert table.vertices.shape == (15, 3)
+        for i, surface in enumerate(table.surfaces):
+            poly = Polygon3D(surface.coords)
+            assert almostequal(table.normals[i], poly.normal_vector)
+            assert almostequal(table.distances[i], poly.distance)
+            assert almostequal(table.areas[i], poly.area)
+            assert np.allclose(table.mins[i], poly.points_matrix.min(axis=0))
+            assert np.allclose(table.maxs[i], poly.points_matrix.max(axis=0))
+
+    def test_write_back(self, base_idf):
+        # type: (IDF) -> None
+        table = base_idf.geometry_table(keys=['BUILDINGSURFACE:DETAILED'])
+        table.set_vertices(table.vertices + [10, 0, 0])
+        assert almostequal(table.mins[0], [11, 1, 0])
+        table.write_back(normalize=False)
+        floor = base_idf.getobject('BUILDINGSURFACE:DETAILED', 'z1_FLOOR')
+        assert almostequal(floor.coords[0], (11.0, 2.1, 0.0))
+        table.write_back()
+        wall = base_idf.getobject('BUILDINGSURFACE:DETAILED', 'z1_WALL_0001')
+        assert almostequal(Polygon3D(wall.coords).normal_vector, table.normals[1])
+        with pytest.raises(ValueError):
+            table.set_vertices(table.vertices[:-1])
@@ -0,0 +1,54 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for idd_cache.py"""
+import os
+
+import eppy
+from eppy.iddcurrent import iddcurrent
+from six import StringIO
+
+from geomeppy.idd_cache import cache_path, extractidddata, IDD_CACHE_ENV, save_cache
+
+
+def test_idd_cache(tmpdir, monkeypatch):
+    # type: (...) -> None
+    monkeypatch.delenv(IDD_CACHE_ENV, raising=False)
+    cache_dir = str(tmpdir)
+    parsed = extractidddata(StringIO(iddcurrent.iddtxt))
+    assert not os.listdir(cache_dir)
+
+    first = extractidddata(StringIO(iddcurrent.iddtxt), cache_dir)
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1
+    second = extractidddata(StringIO(iddcurrent.iddtxt), cache_dir)
+    assert first == second == parsed
+
+    # a damaged cache file is parsed again and replaced
+    cache_file = os.path.join(cache_dir, cache_files[0])
+    with open(cache_file, 'wb') as f:
+        f.write(b'not a pickle')
+    assert extractidddata(StringIO(iddcurrent.iddtxt), cache_dir) == parsed
+    assert os.listdir(cache_dir) == cache_files
+
+    monkeypatch.setenv(IDD_CACHE_ENV, cache_dir)
+    assert extractidddata(StringIO(iddcurrent.iddtxt)) == parsed
+
+
+def test_save_cache_failure(tmpdir):
+    # type: (...) -> None
+    cache_dir = str(tmpdir)
+    # generators cannot be pickled
+    save_cache(cache_path(cache_dir, 'digest'), ([], [], {'key': (x for x in [])}))
+    assert not os.listdir(cache_dir)
+
+
+def test_cache_path_eppy_version(monkeypatch):
+    # type: (...) -> None
+    path = cache_path('cache', 'digest')
+    monkeypatch.setattr(eppy, '__version__', 'other', raising=False)
+    assert cache_path('cache', 'digest') != path
+    assert cache_path('cache', 'digest').endswith('-eppyother.pickle')
@@ -12,7 +12,8 @@ from six import StringIO
 
 from geomeppy.eppy_patches import IDF
 from geomeppy.geom.intersect_match import (
-    get_adjacencies, getidfsurfaces, intersect, intersect_idf_surfaces, is_hole, match_idf_surfaces, unique,
+    adjacent_polygons, get_adjacencies, get_adjacency_stats, getidfsurfaces, intersect, intersect_idf_surfaces, is_hole,
+    match_idf_surfaces, reset_adjacency_stats, unique,
 )
 from geomeppy.geom.polygons import Polygon3D
 from geomeppy.recipes import translate_coords
@@ -87,6 +88,52 @@ def test_unique():
     assert len(unique_polys) == 2
     for poly in polys:
         assert poly in unique_polys
+
+
+def test_adjacency_rejections():
+    # type: () -> None
+    reset_adjacency_stats()
+    poly1 = Polygon3D([(0,1,0),(0,0,0),(1,0,0),(1,1,0)])
+    far = Polygon3D([(100,1,0),(100,0,0),(101,0,0),(101,1,0)])
+    above = Polygon3D([(0,1,1),(0,0,1),(1,0,1),(1,1,1)])
+    overlap = Polygon3D([(0.5,1,0),(1.5,1,0),(1.5,0,0),(0.5,0,0)])
+    assert adjacent_polygons(poly1, far) is None
+    assert adjacent_polygons(poly1, above) is None
+    assert adjacent_polygons(poly1, overlap)
+    stats = get_adjacency_stats()
+    assert stats['rejected_box'] == 1
+    assert stats['rejected_plane'] == 1
+    assert stats['clipped'] == 1
+    assert stats['intersected'] == 1
+    reset_adjacency_stats()
+    assert not any(get_adjacency_stats().values())
+
+
+def test_unique_subset():
+    # type: () -> None
+    poly1 = Polygon3D([(0,1,0),(0,0,0),(1,0,0),(1,1,0)])
+    poly2 = Polygon3D([(0,0.5,0),(0,0,0),(0.5,0,0),(0.5,0.5,0)])
+    poly3 = Polygon3D([(0,1,1),(0,0,1),(1,0,1),(1,1,1)])
+    # a polygon contained in an earlier polygon in the same plane is not kept
+    assert unique([poly1, poly2, poly3]) == [poly1, poly3]
+    assert len(unique([poly2, poly1])) == 2
+
+
+def test_unique_near_duplicates():
+    # type: () -> None
+    poly1 = Polygon3D([(0,1,0),(0,0,0),(1,0,0),(1,1,0)])
+    poly2 = Polygon3D([(0,1,0),(0,0,0),(1 + 1e-7,0,0),(1 + 1e-7,1,0)])
+    # the vertices are on the same fingerprint grid but the polygons are not equal when clipped
+    assert unique([poly1, poly2]) == [poly1, poly2]
+    assert unique([poly2, poly1]) == [poly2]
+
+
+def test_unique_degenerate():
+    # type: () -> None
+    square = Polygon3D([(0,1,0),(0,0,0),(1,0,0),(1,1,0)])
+    line = Polygon3D([(0,0,0),(1,0,0),(2,0,0)])
+    assert unique([square, line]) == [square, line]
+    assert len(unique([line, square, line])) == 2
     
     
 class TestSimpleTestPolygons():
@@ -293,7 +340,29 @@ class TestMatchSurfaces():
             'BUILDINGSURFACE:DETAILED', 'z1_FLOOR')
         assert ground.Outside_Boundary_Condition == 'ground'
         assert ground.Outside_Boundary_Condition_Object == ''
-        
+
+    def test_intersect_parallel(self):
+        # type: () -> None
+        idf = self.idf
+        serial = IDF(StringIO(idf.idfstr()))
+        intersect_idf_surfaces(serial)
+        idf.intersect(workers=2)
+        assert idf.idfstr() == serial.idfstr()
+
+    def test_matches_are_symmetric(self):
+        # type: () -> None
+        idf = self.idf
+        intersect_idf_surfaces(idf)
+        match_idf_surfaces(idf)
+        for s in idf.getsurfaces():
+            if s.Outside_Boundary_Condition == 'surface':
+                other = idf.getobject('BUILDINGSURFACE:DETAILED', s.Outside_Boundary_Condition_Object)
+                assert other.Outside_Boundary_Condition == 'surface'
+                assert other.Outside_Boundary_Condition_Object == s.Name
+            elif s.Outside_Boundary_Condition == 'outdoors':
+                expected = 'NoSun' if almostequal(Polygon3D(s.coords).normal_vector, (0, 0, -1)) else 'SunExposed'
+                assert s.Sun_Exposure == expected
+
 
 class TestAdjacencies():
     
@@ -0,0 +1,50 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for kernels.py"""
+import numpy as np
+
+from geomeppy.geom.kernels import (
+    areas, bounding_boxes, centroids, normal_vectors, pad_polygons, plane_distances,
+)
+from geomeppy.geom.polygons import Polygon3D
+
+square = [(0, 0, 1), (2, 0, 1), (2, 2, 1), (0, 2, 1)]
+triangle = [(0, 0, 0), (0, 0, 3), (0, 4, 0)]
+
+
+def test_single_polygon():
+    # type: () -> None
+    points = np.array(square, dtype=float)
+    assert np.allclose(normal_vectors(points), [0, 0, 1])
+    assert np.isclose(areas(points), 4)
+    assert np.allclose(centroids(points), [1, 1, 1])
+    assert np.isclose(plane_distances(points), 1)
+    mins, maxs = bounding_boxes(points)
+    assert np.allclose(mins, [0, 0, 1])
+    assert np.allclose(maxs, [2, 2, 1])
+
+
+def test_padded_batch():
+    # type: () -> None
+    vertices = np.array(square + triangle, dtype=float)
+    points, counts = pad_polygons(vertices, [0, 4, 7])
+    assert points.shape == (2, 4, 3)
+    assert list(counts) == [4, 3]
+    assert np.allclose(areas(points), [4, 6])
+    assert np.allclose(centroids(points, counts), [[1, 1, 1], [0, 4 / 3., 1]])
+    for poly, normal in zip([square, triangle], normal_vectors(points)):
+        assert np.allclose(normal, Polygon3D(poly).normal_vector)
+    mins, maxs = bounding_boxes(points)
+    assert np.allclose(mins[1], [0, 0, 0])
+    assert np.allclose(maxs[1], [0, 4, 3])
+
+
+def test_degenerate_polygon():
+    # type: () -> None
+    points = np.array([(0, 0, 0), (1, 1, 1), (2, 2, 2)], dtype=float)
+    assert np.allclose(normal_vectors(points), [0, 0, 0])
+    assert areas(points) == 0
@@ -6,8 +6,12 @@
 # =======================================================================
 """pytest for polygons.py"""
 
+import numpy as np
+import pyclipper as pc
+import pytest
+
 from geomeppy.geom.polygons import (
-    break_polygons, difference_3D_polys, intersect_3D_polys, Polygon, Polygon3D, union_2D_polys, union_3D_polys,
+    break_polygons, clip_3D_polys, difference_3D_polys, intersect_3D_polys, Polygon, Polygon3D, union_2D_polys, union_3D_polys,
     Vector2D, Vector3D,
 )
 from geomeppy.geom.segments import Segment
@@ -457,6 +461,19 @@ def test_difference_3D_polys_multi():
     assert s2.difference(s1) == ex_s2
 
 
+def test_clip_3D_polys():
+    # type: () -> None
+    s1 = Polygon3D([(0,0,0), (5,0,0), (5,2,0), (0,2,0)])
+    s2 = Polygon3D([(1,1,0), (2,1,0), (2,2,0), (3,2,0),
+                    (3,1,0), (4,1,0), (4,3,0), (1,3,0)])
+    intersection, difference = clip_3D_polys(s1, s2, [pc.CT_INTERSECTION, pc.CT_DIFFERENCE])
+    assert intersection == intersect_3D_polys(s1, s2)
+    assert difference == difference_3D_polys(s1, s2)
+    # polygons in different planes don't clip
+    s3 = Polygon3D([(0,0,1), (5,0,1), (5,2,1), (0,2,1)])
+    assert clip_3D_polys(s1, s3, [pc.CT_INTERSECTION, pc.CT_DIFFERENCE]) == [[], []]
+
+
 def test_surface_normal():
     # type: () -> None
     poly = Polygon3D([Vector3D(0.0, 0.0, 0.0),
@@ -560,19 +577,36 @@ def test_invert():
 def test_set_length():
     # type: () -> None
     v = Vector3D(1, 1, 1)
-    v.set_length(1)
-    for i in v:
+    for i in v.set_length(1):
         assert almostequal(i, 0.57735026)
 
 
 def test_normalize():
     # type: () -> None
     v = Vector3D(1, 1, 1)
-    v.normalize()
-    for i in v:
+    for i in v.normalize():
         assert almostequal(i, 0.57735026)
 
 
+def test_vector_storage():
+    # type: () -> None
+    v = Vector3D(1, 2, 3)
+    assert not hasattr(v, '__dict__')
+    assert v.args == (1.0, 2.0, 3.0)
+    assert (v.x, v.y, v.z) == v.args
+    assert v - [1, 1, 1] == Vector3D(0, 1, 2)
+    assert -v == Vector3D(-1, -2, -3)
+    # vectors are immutable, so they keep their hash
+    key = hash(v)
+    with pytest.raises(TypeError):
+        v[0] = 4
+    assert v.set_length(2) is not v
+    assert v.normalize() is not v
+    assert hash(v) == key
+    assert v.args == (1.0, 2.0, 3.0)
+    assert Vector2D(1, 2) + Vector2D(1, 1) == Vector2D(2, 3)
+
+
 def test_on_poly_edge():
     # type: () -> None
     poly = Polygon3D([(0,4,0),(0,0,0),(4,0,0),(4,4,0)])
@@ -588,3 +622,61 @@ def test_closest():
     poly = Polygon3D([(1,1,1), (2,2,3), (3,4,5)])
     assert pt.closest(poly) == Vector3D(1,1,1)
 
+
+
+def test_polygon_vertex_array():
+    # type: () -> None
+    poly = Polygon3D([(0,0,0), (0,1,1), (1,1,1), (1,0,0)])
+    matrix = poly.points_matrix
+    assert matrix.shape == (4, 3)
+    assert not matrix.flags.writeable
+    # 2D vertices are padded with z = 0
+    assert Polygon3D([(0,0), (0,1), (1,1)]).zs == [0, 0, 0]
+    # homogeneous coordinates are dropped
+    homogeneous = np.hstack([matrix, np.ones((4, 1))])
+    poly4 = Polygon3D(homogeneous)
+    assert poly4.points_matrix.shape == (4, 3)
+    assert poly4.points_matrix.flags.c_contiguous
+    assert poly4 == poly
+    assert list(poly4) == list(poly)
+    assert Polygon3D(homogeneous.tolist()).points_matrix.shape == (4, 3)
+
+
+def test_polygon_mutators():
+    # type: () -> None
+    poly = Polygon3D([(0,0,0), (0,1,0), (1,1,0)])
+    poly.insert(3, Vector3D(1,0,0))
+    assert poly == Polygon3D([(0,0,0), (0,1,0), (1,1,0), (1,0,0)])
+    poly[3] = (2,0,0)
+    assert poly[3] == Vector3D(2,0,0)
+    del poly[3]
+    assert len(poly) == 3
+    assert poly[:2] == [Vector3D(0,0,0), Vector3D(0,1,0)]
+
+
+def test_cached_geometry_invalidated():
+    # type: () -> None
+    poly = Polygon3D([(0,0,0), (1,0,0), (1,1,0), (0,1,0)])
+    assert poly.normal_vector == [0.0, 0.0, 1.0]
+    assert poly.area == 1
+    # a longer normal vector is a new vector, so the cached value is unchanged
+    assert poly.normal_vector.set_length(10) == [0.0, 0.0, 10.0]
+    assert poly.normal_vector == [0.0, 0.0, 1.0]
+    # mutating the polygon invalidates the cached values
+    poly[2] = (1,2,0)
+    assert poly.area == 1.5
+    poly.insert(0, (0,0,1))
+    assert poly.distance != 0
+    del poly[0]
+    assert poly.distance == 0
+    assert len(poly.edges) == 4
+
+
+def test_cached_clipper_path():
+    # type: () -> None
+    poly = Polygon3D([(0,0,1), (1,0,1), (1,1,1), (0,1,1)])
+    path = poly._clipper_path()
+    assert path == pc.scale_to_clipper(poly.project_to_2D().vertices_list)
+    assert poly._clipper_path() is path
+    poly[2] = (2,2,1)
+    assert poly._clipper_path() == pc.scale_to_clipper([(0,0), (1,0), (2,2), (0,1)])
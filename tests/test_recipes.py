@@ -7,6 +7,7 @@
 """pytest for recipes.py"""
 
 from eppy.iddcurrent import iddcurrent
+import numpy as np
 import pytest
 from six import StringIO
 
@@ -15,7 +16,10 @@ from geomeppy.geom.intersect_match import (
     getidfsurfaces, getidfshadingsurfaces, intersect_idf_surfaces, match_idf_surfaces)
 from geomeppy.geom.polygons import Polygon3D
 from geomeppy.geom.vectors import Vector2D, Vector3D
-from geomeppy.recipes import rotate, set_wwr, translate, translate_to_origin
+from geomeppy.recipes import (
+    rotate, set_wwr, subsurface_index, translate, translate_to_origin, window_vertices_given_wall,
+    window_vertices_given_walls,
+)
 from geomeppy.utilities import almostequal
 from geomeppy.view_geometry import _get_collections, _get_shading, _get_surfaces
 
@@ -131,6 +135,31 @@ class TestTranslate():
         floor2 = Polygon3D(idf2.getsurfaces('floor')[0].coords).normalize_coords(None)
         assert almostequal(floor1, floor2)
 
+    def test_transform_context(self, base_idf):
+        # type: () -> None
+        idf1 = base_idf
+        idf2 = IDF()
+        idf2.initreadtxt(idf1.idfstr())
+        idf1.translate((5, 2))
+        idf1.rotate(30)
+        idf1.scale(2)
+        with idf2.transform() as t:
+            t.translate((5, 2)).rotate(30).scale(2)
+            assert almostequal(t.centroid, idf1.centroid)
+        for key in ['BUILDINGSURFACE:DETAILED', 'SHADING:ZONE:DETAILED']:
+            for s1, s2 in zip(idf1.idfobjects[key], idf2.idfobjects[key]):
+                assert almostequal(s1.coords, s2.coords)
+
+    def test_translate_without_normalize(self, base_idf):
+        # type: () -> None
+        idf = base_idf
+        idf.translate((0, 0))  # normalise all surfaces
+        expected = [Vector3D(*v) + Vector3D(50, 100, 0) for v in idf.getsurfaces()[0].coords]
+        idf.translate((50, 100), normalize=False)
+        assert almostequal(idf.getsurfaces()[0].coords, expected)
+        idf.translate((-50, -100))
+        assert almostequal(idf.getsurfaces()[0].coords[0], (2.0, 2.0, 0.0))
+
 
 class TestMatchSurfaces():
 
@@ -255,3 +284,55 @@ class TestWWR:
         idf.set_wwr(wwr, force=True)
         assert self.is_expected_wwr(idf, wwr)
 
+
+    def test_wwr_repeated(self, wwr_idf):
+        idf = wwr_idf
+        for wwr in [0.2, 0.4]:
+            idf.set_wwr(wwr)
+            assert self.is_expected_wwr(idf, wwr)
+        windows = idf.idfobjects['FENESTRATIONSURFACE:DETAILED']
+        assert [w.Name for w in windows] == ['wall1 window']
+        assert len(idf.model.dt['FENESTRATIONSURFACE:DETAILED']) == 1
+        assert [ss.Name for ss in subsurface_index(idf)['wall1']] == ['wall1 window']
+
+    def test_window_vertices_given_walls(self, wwr_idf):
+        wall = wwr_idf.getobject('BUILDINGSURFACE:DETAILED', 'wall1')
+        other = [[2, 0, 0], [2, 3, 0], [2, 3, 2], [2, 0, 2], [2, -1, 1]]
+        vertices = np.vstack([wall.coords, other])
+        windows = window_vertices_given_walls(vertices, [0, 4, 9], 0.5)
+        assert almostequal(windows[:4], window_vertices_given_wall(wall, 0.5))
+        assert almostequal(windows[4:, 2], [0.5, 0.5, 1.5, 1.5, 1.0])
+
+    def test_wwr_map(self, wwr_idf):
+        idf = wwr_idf
+        wall = idf.getobject('BUILDINGSURFACE:DETAILED', 'wall1')
+        idf.set_wwr(0.2, wwr_map={int(round(wall.azimuth)): 0.3})
+        assert self.is_expected_wwr(idf, 0.3)
+        idf.set_wwr(0.2, wwr_map={int(round(wall.azimuth)): 0.3, 'wall1': 0.4})
+        assert self.is_expected_wwr(idf, 0.4)
+        idf.set_wwr(0.2, wwr_map={'wall1': 0})
+        assert not idf.getsubsurfaces('window')
+
+    def test_wwr_sill_height_and_windows(self, wwr_idf):
+        idf = wwr_idf
+        wwr = 0.3
+        idf.set_wwr(wwr, sill_height=0.2, n_windows=2)
+        assert self.is_expected_wwr(idf, wwr)
+        windows = idf.getsubsurfaces('window')
+        assert [w.Name for w in windows] == ['wall1 window 1', 'wall1 window 2']
+        for window in windows:
+            assert almostequal(min(z for _x, _y, z in window.coords), 0.2)
+            assert almostequal(window.area, 0.15)
+        names = [w.Name for w in windows]
+        with pytest.raises(ValueError):
+            idf.set_wwr(0.9, sill_height=0.2)
+        assert [w.Name for w in idf.getsubsurfaces('window')] == names
+        with pytest.raises(ValueError):
+            idf.set_wwr(wwr, sill_height=-0.1)
+        assert [w.Name for w in idf.getsubsurfaces('window')] == names
+        with pytest.raises(ValueError):
+            idf.set_wwr(wwr, n_windows=0)
+        assert [w.Name for w in idf.getsubsurfaces('window')] == names
+        # walls which get no windows are not checked
+        idf.set_wwr(wwr, sill_height=2, wwr_map={'wall1': 0})
+        assert not idf.getsubsurfaces('window')
@@ -0,0 +1,58 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for spatial_index.py"""
+from itertools import combinations
+
+from geomeppy.geom.polygons import Polygon3D
+from geomeppy.geom.spatial_index import box_contains, candidate_pairs, cell_keys, fingerprint, plane_buckets
+
+
+def test_cell_keys():
+    # type: () -> None
+    # values in the middle of a cell only have one key
+    assert cell_keys([0.0005], 1e-4, 1e-3) == [(0,)]
+    # values near the edge of a cell share a key with their neighbours
+    below = set(cell_keys([0.00099], 1e-4, 1e-3))
+    above = set(cell_keys([0.00101], 1e-4, 1e-3))
+    assert below & above
+    assert len(cell_keys([0.00099, 0.00099], 1e-4, 1e-3)) == 4
+
+
+def test_plane_buckets():
+    # type: () -> None
+    poly1 = Polygon3D([(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)])  # facing up
+    poly2 = Polygon3D([(0, 1, 1), (1, 1, 1), (1, 0, 1), (0, 0, 1)])  # facing down
+    poly3 = Polygon3D([(0, 0, 2), (1, 0, 2), (1, 1, 2), (0, 1, 2)])  # different plane
+    buckets = plane_buckets([poly1, poly2, poly3])
+    assert [0, 1] in buckets.values()
+    assert [2] in buckets.values()
+
+
+def test_candidate_pairs():
+    # type: () -> None
+    floor = Polygon3D([(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)])
+    ceiling = Polygon3D([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    overlapping = Polygon3D([(0.5, 0.5, 0), (1.5, 0.5, 0), (1.5, 1.5, 0), (0.5, 1.5, 0)])
+    distant = Polygon3D([(100, 0, 0), (101, 0, 0), (101, 1, 0), (100, 1, 0)])
+    wall = Polygon3D([(0, 0, 1), (0, 0, 0), (1, 0, 0), (1, 0, 1)])
+    polys = [floor, ceiling, overlapping, distant, wall]
+    result = candidate_pairs(polys)
+    assert result == [(0, 1), (0, 2), (1, 2)]
+    assert set(result) <= set(combinations(range(len(polys)), 2))
+
+
+def test_fingerprint():
+    # type: () -> None
+    poly1 = Polygon3D([(0, 1, 0), (0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    poly2 = Polygon3D([(1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 0)])
+    poly3 = Polygon3D([(1, 1, 0), (1, 0, 0), (0, 0, 0), (0, 1, 0)])
+    # the starting vertex doesn't matter, but the orientation does
+    assert fingerprint(poly1) == fingerprint(poly2)
+    assert fingerprint(poly1) != fingerprint(poly3)
+    inner = Polygon3D([(0.5, 0.5, 0), (0.5, 0, 0), (1, 0, 0), (1, 0.5, 0)])
+    assert box_contains(poly1, inner)
+    assert not box_contains(inner, poly1)
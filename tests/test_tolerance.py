@@ -0,0 +1,34 @@
+# Copyright (c) 2016 Jamie Bull
+# =======================================================================
+#  Distributed under the MIT License.
+#  (See accompanying file LICENSE or copy at
+#  http://opensource.org/licenses/MIT)
+# =======================================================================
+"""pytest for tolerance.py"""
+import numpy as np
+
+from geomeppy.geom.tolerance import arrays_isclose, isclose, vectors_isclose
+from geomeppy.geom.vectors import Vector3D
+from geomeppy.utilities import almostequal
+
+
+def test_isclose():
+    # type: () -> None
+    for a, b, places in [(1.0, 1.00000001, 7), (1.0, 1.000001, 7), (0.12345, 0.12349, 4), (-2.0, 2.0, 1)]:
+        assert isclose(a, b, places) == almostequal(a, b, places)
+
+
+def test_vectors_isclose():
+    # type: () -> None
+    assert vectors_isclose(Vector3D(0, 0, 1), (0, 0, 1.00000001))
+    assert not vectors_isclose(Vector3D(0, 0, 1), (0, 0, -1))
+    assert vectors_isclose(np.array([0.5, 0.5, 0]), (0.50001, 0.5, 0), 4)
+    assert not vectors_isclose(np.array([0.5, 0.5, 0]), (0.5001, 0.5, 0), 4)
+
+
+def test_arrays_isclose():
+    # type: () -> None
+    square = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], dtype=float)
+    assert arrays_isclose(square, square + 1e-9)
+    assert not arrays_isclose(square, square + 1e-6)
+    assert not arrays_isclose(square, square[:3])
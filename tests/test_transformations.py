@@ -9,7 +9,9 @@ import numpy as np
 from transforms3d._gohlketransforms import translation_matrix
 
 from geomeppy.geom.polygons import Polygon3D
-from geomeppy.geom.transformations import Transformation
+from geomeppy.geom.transformations import (
+    align_face, alignment_axes, invert_align_face, plane_axes, transform_polygons, Transformation,
+)
 from geomeppy.geom.vectors import Vector3D
 from geomeppy.utilities import almostequal
 
@@ -165,3 +167,26 @@ class TestTransormations():
         tempVertices = t._inverse() * testVertices
         expectedVertices = Polygon3D([(0,0,0),(27.69,0,0),(22.69,5,0),(5,5,0)])
         assert almostequal(tempVertices, expectedVertices, tol)
+
+    def test_transform_polygons(self):
+        # type: () -> None
+        tol = 12  # places
+        rotation = Transformation()._rotation(Vector3D(0, 0, 1), np.deg2rad(90))
+        square = Polygon3D([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+        triangle = Polygon3D([(0, 0, 1), (2, 0, 1), (0, 2, 1)])
+        result = transform_polygons(rotation, [square, triangle])
+        for poly, rotated in zip([square, triangle], result):
+            assert len(poly) == len(rotated)
+            assert almostequal(rotated, Polygon3D([rotation * v for v in poly]), tol)
+        assert transform_polygons(rotation, []) == []
+
+    def test_alignment_axes_cache(self):
+        # type: () -> None
+        tol = 12  # places
+        wall = Polygon3D([(0, 0, 1), (0, 0, 0), (2, 0, 0), (2, 0, 1)])
+        other_wall = Polygon3D([(5, 1, 3), (5, 1, 0), (8, 1, 0), (8, 1, 3)])
+        assert alignment_axes(wall._normal_vector()) is alignment_axes(other_wall._normal_vector())
+        assert almostequal(alignment_axes(wall.normal_vector), plane_axes(wall.normal_vector), tol)
+        aligned = align_face(wall)
+        assert aligned.is_horizontal
+        assert almostequal(invert_align_face(wall, aligned), wall, tol)